@@ -1,6 +1,18 @@
 """LoggingAnalysis - AI驱动的日志分析工具。"""
 
-from logginganalysis.analyzer import LogAnalyzer
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from logginganalysis.analyzer import LogAnalyzer
 
 __version__ = "0.1.0"
 __all__ = ["LogAnalyzer", "__version__"]
+
+
+def __getattr__(name: str) -> Any:
+    """延迟导入 LogAnalyzer，避免导入子模块时加载 LangChain。"""
+    if name == "LogAnalyzer":
+        from logginganalysis.analyzer import LogAnalyzer
+
+        return LogAnalyzer
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -70,21 +70,30 @@ class LogAnalyzer:
             total: 总数
             extra: 额外信息
         """
-        progress_info: dict[str, Any] = {
-            "step": step,
-            "progress_message": message,
-        }
+        log_enabled = logger.isEnabledFor(logging.INFO)
+        if not log_enabled and not self.progress_callback:
+            return
+
+        progress: str | None = None
         if current is not None and total is not None:
-            progress_info["progress"] = f"{current}/{total} ({current / total * 100:.1f}%)"
-        if extra:
-            progress_info.update(extra)
+            progress = f"{current}/{total} ({current / total * 100:.1f}%)"
+
+        if log_enabled:
+            progress_info: dict[str, Any] = {
+                "step": step,
+                "progress_message": message,
+            }
+            if progress is not None:
+                progress_info["progress"] = progress
+            if extra:
+                progress_info.update(extra)
 
-        logger.info(f"[{step}] {message}", extra=progress_info)
+            logger.info("[%s] %s", step, message, extra=progress_info)
 
         if self.progress_callback:
             callback_info: dict[str, Any] = {"step": step, "message": message}
-            if current is not None and total is not None:
-                callback_info["progress"] = f"{current}/{total} ({current / total * 100:.1f}%)"
+            if progress is not None:
+                callback_info["progress"] = progress
             if extra:
                 callback_info.update(extra)
             self.progress_callback(callback_info)
@@ -187,7 +196,7 @@ class LogAnalyzer:
         Returns:
             AnalysisReport: 分析报告
         """
-        logger.info(f"准备读取日志文件: {file_path}")
+        logger.info("准备读取日志文件: %s", file_path)
 
         # 读取文件
         try:
@@ -199,10 +208,10 @@ class LogAnalyzer:
             with open(file_path, "r", encoding="latin-1") as f:
                 log_content = f.read()
         except FileNotFoundError:
-            logger.error(f"文件不存在: {file_path}")
+            logger.error("文件不存在: %s", file_path)
             raise
         except Exception as e:
-            logger.error(f"读取文件失败: {e}", exc_info=True)
+            logger.error("读取文件失败: %s", e, exc_info=True)
             raise
 
         return await self.analyze(
@@ -79,8 +79,11 @@ class LogChunker:
             # 使用 LangChain 分割器进行分块
             texts = self.splitter.split_text(log_content)
 
-            # 计算每个块的起始和结束位置
+            # 计算每个块的起始和结束位置；字段均由此处计算得出，跳过模型校验。
+            # 块内容直接使用分割结果，不做按偏移延迟切片的视图：LogChunks.chunks 是公开的
+            # list[LogChunk]，提取器也需要物化后的 content，视图最终仍要全部转换
             chunks: list[LogChunk] = []
+            total_size = 0
             current_position = 0
             base_metadata = metadata or {}
 
@@ -92,25 +95,23 @@ class LogChunker:
                     start_index = current_position
                 end_index = start_index + len(text)
 
-                # 创建日志块
-                chunk = LogChunk(
-                    content=text,
-                    start_index=start_index,
-                    end_index=end_index,
-                    metadata={
-                        **base_metadata,
-                        "chunk_number": i + 1,
-                        "chunk_strategy": self.strategy.value,
-                    },
+                chunks.append(
+                    LogChunk.model_construct(
+                        content=text,
+                        start_index=start_index,
+                        end_index=end_index,
+                        metadata={
+                            **base_metadata,
+                            "chunk_number": i + 1,
+                            "chunk_strategy": self.strategy.value,
+                        },
+                    )
                 )
-                chunks.append(chunk)
+                total_size += len(text)
 
                 # 更新当前位置（考虑重叠）
                 current_position = end_index - self.chunk_overlap if i > 0 else end_index
 
-            # 计算总大小
-            total_size = sum(len(chunk.content) for chunk in chunks)
-
             return LogChunks(
                 chunks=chunks,
                 total_size=total_size,
@@ -3,6 +3,8 @@
 使用 pydantic-settings 从环境变量或 .env 文件加载配置。
 """
 
+from functools import lru_cache
+
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -75,22 +77,15 @@ class Settings(BaseSettings):
     )
 
 
-# 全局配置实例
-_settings: Settings | None = None
-
-
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
     """获取配置实例。
 
-    使用单例模式，确保只加载一次配置。
+    使用 lru_cache 实现单例，确保只加载一次配置。
     """
-    global _settings
-    if _settings is None:
-        _settings = Settings()
-    return _settings
+    return Settings()
 
 
 def reset_settings() -> None:
     """重置配置实例（主要用于测试）。"""
-    global _settings
-    _settings = None
+    get_settings.cache_clear()
@@ -2,6 +2,8 @@
 
 import asyncio
 import logging
+import time
+from dataclasses import dataclass
 from typing import Any
 
 from pydantic import SecretStr
@@ -18,6 +20,48 @@ from logginganalysis.utils.rate_limiter import RateLimiter, RateLimitConfig
 
 logger = logging.getLogger(__name__)
 
+# 进度回调中使用的步骤和状态值
+_STEP_EXTRACTION = "extraction"
+_STATUS_PROCESSING = "processing"
+_STATUS_COMPLETED = "completed"
+_STATUS_FAILED = "failed"
+
+
+@dataclass(slots=True)
+class _ProgressThrottle:
+    """批量提取时的进度上报节流器（内部使用）。
+
+    第一次总是上报；之后进度增长达到阈值或距上次上报超过最小间隔时才上报。
+    阈值为 0 时每次都上报。
+    """
+
+    threshold_percent: float
+    min_interval_s: float
+    last_percentage: float | None = None
+    last_at: float = 0.0
+
+    def ready(self, percentage: float, force: bool = False) -> bool:
+        """判断本次进度是否需要上报，需要时记录上报位置。
+
+        Args:
+            percentage: 当前进度百分比
+            force: 是否强制上报
+
+        Returns:
+            bool: 是否需要上报
+        """
+        now = time.monotonic()
+        if not (
+            force
+            or self.last_percentage is None
+            or percentage - self.last_percentage >= self.threshold_percent
+            or now - self.last_at >= self.min_interval_s
+        ):
+            return False
+        self.last_percentage = percentage
+        self.last_at = now
+        return True
+
 
 class LogExtractor:
     """日志信息提取器。
@@ -32,6 +76,8 @@ class LogExtractor:
         use_structured_output: bool = False,
         rate_limiter: RateLimiter | None = None,
         progress_callback: Any | None = None,
+        progress_threshold_percent: float = 0.0,
+        progress_min_interval_s: float = 0.05,
     ) -> None:
         """初始化日志提取器。
 
@@ -41,6 +87,9 @@ class LogExtractor:
             use_structured_output: 是否使用 OpenAI 的原生结构化输出
             rate_limiter: 流控器。如果为 None，根据配置创建
             progress_callback: 进度回调函数
+            progress_threshold_percent: 批量提取时，进度增长达到该百分比才上报开始/完成进度
+                （默认为 0，每个chunk都上报）
+            progress_min_interval_s: 批量提取时，距上次上报超过该秒数也会上报开始/完成进度
         """
         settings = get_settings()
 
@@ -75,6 +124,8 @@ class LogExtractor:
             )
         self.rate_limiter = rate_limiter
         self.progress_callback = progress_callback
+        self.progress_threshold_percent = progress_threshold_percent
+        self.progress_min_interval_s = progress_min_interval_s
 
     async def extract_from_chunk(
         self,
@@ -95,21 +146,59 @@ class LogExtractor:
         Raises:
             ExtractionError: 提取失败时抛出
         """
-        logger.info(
-            f"[{chunk_index + 1}/{total_chunks}] "
-            f"开始提取chunk {chunk.id} (大小: {len(chunk.content)} 字符)"
-        )
+        progress_percentage = ((chunk_index + 1) / total_chunks * 100) if total_chunks > 0 else 0
+
+        try:
+            result = await self._extract_chunk(chunk, chunk_index, total_chunks)
+        except ExtractionError as e:
+            self._report_chunk_done(
+                chunk, chunk_index, total_chunks, progress_percentage, e.__cause__ or e
+            )
+            raise
 
-        if self.progress_callback:
-            progress_percentage = (chunk_index / total_chunks * 100) if total_chunks > 0 else 0
+        self._report_chunk_done(chunk, chunk_index, total_chunks, progress_percentage, result)
+        return result
+
+    async def _extract_chunk(
+        self,
+        chunk: LogChunk,
+        chunk_index: int,
+        total_chunks: int,
+        throttle: _ProgressThrottle | None = None,
+    ) -> ChunkExtractionResult:
+        """从单个日志块中提取信息，不上报完成进度。
+
+        Args:
+            chunk: 日志块
+            chunk_index: chunk索引
+            total_chunks: 总chunk数
+            throttle: 开始进度的节流器，为 None 时总是上报
+
+        Returns:
+            ChunkExtractionResult: 提取结果
+
+        Raises:
+            ExtractionError: 提取失败时抛出
+        """
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "[%d/%d] 开始提取chunk %s (大小: %d 字符)",
+                chunk_index + 1,
+                total_chunks,
+                chunk.id,
+                len(chunk.content),
+            )
+
+        progress_percentage = (chunk_index / total_chunks * 100) if total_chunks > 0 else 0
+        if self.progress_callback and (throttle is None or throttle.ready(progress_percentage)):
             self.progress_callback(
                 {
-                    "step": "extraction",
+                    "step": _STEP_EXTRACTION,
                     "chunk_id": chunk.id,
                     "chunk_index": chunk_index + 1,
                     "total_chunks": total_chunks,
                     "progress_percentage": progress_percentage,
-                    "status": "processing",
+                    "status": _STATUS_PROCESSING,
                 }
             )
 
@@ -118,13 +207,11 @@ class LogExtractor:
             await self.rate_limiter.wait_for_permission(tokens=1)
 
         try:
-            from logginganalysis.models.extraction import ChunkExtractionResult
-
             chain_result = await self.chain.ainvoke({"log_chunk": chunk.content})
 
             # 检查是否返回了 None
             if chain_result is None:
-                logger.warning(f"[{chunk_index + 1}/{total_chunks}] AI 返回了 None，使用空结果")
+                logger.warning("[%d/%d] AI 返回了 None，使用空结果", chunk_index + 1, total_chunks)
                 result = ChunkExtractionResult(
                     chunk_id=chunk.id,
                     exceptions=[],
@@ -135,62 +222,77 @@ class LogExtractor:
             else:
                 result = chain_result
 
-            # 确保结果包含正确的 chunk_id
-            result.chunk_id = chunk.id
-
-            logger.info(
-                f"[{chunk_index + 1}/{total_chunks}] 成功提取chunk {chunk.id}，"
-                f"发现 {len(result.exceptions)} 个异常，"
-                f"{len(result.problematic_behaviors)} 个问题行为，{len(result.libraries)} 个库引用"
-            )
-
-            if self.progress_callback:
-                progress_percentage = (
-                    ((chunk_index + 1) / total_chunks * 100) if total_chunks > 0 else 0
-                )
-                self.progress_callback(
-                    {
-                        "step": "extraction",
-                        "chunk_id": chunk.id,
-                        "chunk_index": chunk_index + 1,
-                        "total_chunks": total_chunks,
-                        "progress_percentage": progress_percentage,
-                        "status": "completed",
-                        "exceptions_found": len(result.exceptions),
-                        "behaviors_found": len(result.problematic_behaviors),
-                        "libraries_found": len(result.libraries),
-                    }
+            # 确保结果包含正确的 chunk_id（结果模型不可变，需要时复制）
+            if result.chunk_id != chunk.id:
+                result = result.model_copy(update={"chunk_id": chunk.id})
+
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "[%d/%d] 成功提取chunk %s，发现 %d 个异常，%d 个问题行为，%d 个库引用",
+                    chunk_index + 1,
+                    total_chunks,
+                    chunk.id,
+                    len(result.exceptions),
+                    len(result.problematic_behaviors),
+                    len(result.libraries),
                 )
 
             return result
 
         except Exception as e:
             logger.error(
-                f"[{chunk_index + 1}/{total_chunks}] 从chunk {chunk.id} 提取失败: {e}",
+                "[%d/%d] 从chunk %s 提取失败: %s",
+                chunk_index + 1,
+                total_chunks,
+                chunk.id,
+                e,
                 extra={"chunk_id": chunk.id, "chunk_size": len(chunk.content)},
             )
 
-            if self.progress_callback:
-                progress_percentage = (
-                    ((chunk_index + 1) / total_chunks * 100) if total_chunks > 0 else 0
-                )
-                self.progress_callback(
-                    {
-                        "step": "extraction",
-                        "chunk_id": chunk.id,
-                        "chunk_index": chunk_index + 1,
-                        "total_chunks": total_chunks,
-                        "progress_percentage": progress_percentage,
-                        "status": "failed",
-                        "error": str(e),
-                    }
-                )
-
             raise ExtractionError(
                 f"从块 {chunk.id} 提取信息失败: {e}",
                 details={"chunk_id": chunk.id, "chunk_size": len(chunk.content)},
             ) from e
 
+    def _report_chunk_done(
+        self,
+        chunk: LogChunk,
+        chunk_index: int,
+        total_chunks: int,
+        progress_percentage: float,
+        outcome: ChunkExtractionResult | BaseException,
+    ) -> None:
+        """上报单个chunk的完成（或失败）进度。
+
+        Args:
+            chunk: 日志块
+            chunk_index: chunk索引
+            total_chunks: 总chunk数
+            progress_percentage: 进度百分比
+            outcome: 提取结果，或失败时的异常
+        """
+        if not self.progress_callback:
+            return
+
+        # 每次上报都创建新字典，不复用：回调（如 demo.py 和测试）可能保存收到的字典
+        update: dict[str, Any] = {
+            "step": _STEP_EXTRACTION,
+            "chunk_id": chunk.id,
+            "chunk_index": chunk_index + 1,
+            "total_chunks": total_chunks,
+            "progress_percentage": progress_percentage,
+        }
+        if isinstance(outcome, BaseException):
+            update["status"] = _STATUS_FAILED
+            update["error"] = str(outcome)
+        else:
+            update["status"] = _STATUS_COMPLETED
+            update["exceptions_found"] = len(outcome.exceptions)
+            update["behaviors_found"] = len(outcome.problematic_behaviors)
+            update["libraries_found"] = len(outcome.libraries)
+
+        self.progress_callback(update)
+
     async def extract_from_chunks(
         self,
         chunks: LogChunks,
@@ -198,6 +300,10 @@ class LogExtractor:
     ) -> list[ChunkExtractionResult]:
         """从多个日志块中提取信息。
 
+        按完成顺序上报进度，开始和完成进度均按
+        progress_threshold_percent / progress_min_interval_s 合并，
+        结果按原始chunk顺序返回。
+
         Args:
             chunks: 日志块集合
             max_concurrency: 最大并发数
@@ -212,44 +318,78 @@ class LogExtractor:
             logger.info("没有需要提取的chunk")
             return []
 
-        logger.info(f"开始批量提取 {len(chunks.chunks)} 个chunk，最大并发数: {max_concurrency}")
+        total_chunks = len(chunks.chunks)
+        logger.info("开始批量提取 %d 个chunk，最大并发数: %d", total_chunks, max_concurrency)
 
-        try:
-            # 使用信号量限制并发数
-            semaphore = asyncio.Semaphore(max_concurrency)
-
-            async def extract_with_semaphore(
-                chunk: LogChunk, index: int
-            ) -> tuple[int, ChunkExtractionResult | Exception]:
-                async with semaphore:
-                    try:
-                        result = await self.extract_from_chunk(chunk, index, len(chunks.chunks))
-                        return (index, result)
-                    except Exception as e:
-                        return (index, e)
-
-            # 并发提取所有块
-            indexed_results = await asyncio.gather(
-                *[extract_with_semaphore(chunk, i) for i, chunk in enumerate(chunks.chunks)],
-            )
+        # 使用信号量限制并发数
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        # 开始和完成进度分别节流：失败和最后一个chunk的完成进度总是上报
+        started_throttle = _ProgressThrottle(
+            self.progress_threshold_percent, self.progress_min_interval_s
+        )
+        completed_throttle = _ProgressThrottle(
+            self.progress_threshold_percent, self.progress_min_interval_s
+        )
 
-            # 按索引排序，确保结果顺序与原始chunk顺序一致
-            indexed_results.sort(key=lambda x: x[0])
+        async def extract_with_semaphore(
+            chunk: LogChunk, index: int
+        ) -> tuple[int, ChunkExtractionResult | Exception]:
+            async with semaphore:
+                try:
+                    return (
+                        index,
+                        await self._extract_chunk(chunk, index, total_chunks, started_throttle),
+                    )
+                except Exception as e:
+                    return (index, e)
+
+        tasks = [
+            asyncio.create_task(extract_with_semaphore(chunk, i))
+            for i, chunk in enumerate(chunks.chunks)
+        ]
 
-            # 检查是否有异常
-            extractions: list[ChunkExtractionResult] = []
+        try:
+            # 按完成顺序收集结果，写入对应索引位置以保持原始顺序
+            results: list[ChunkExtractionResult | None] = [None] * total_chunks
             errors: list[tuple[int, str, Exception]] = []
 
-            for index, result in indexed_results:
-                if isinstance(result, Exception):
-                    errors.append((index, chunks.chunks[index].id, result))
-                elif isinstance(result, ChunkExtractionResult):
-                    extractions.append(result)
+            # 预先计算第 i 个完成时的进度百分比
+            percentages = [(i + 1) * 100.0 / total_chunks for i in range(total_chunks)]
+            completed = 0
+
+            for next_done in asyncio.as_completed(tasks):
+                index, outcome = await next_done
+                chunk = chunks.chunks[index]
+                progress_percentage = percentages[completed]
+                completed += 1
+
+                if isinstance(outcome, Exception):
+                    errors.append((index, chunk.id, outcome))
+                    self._report_chunk_done(
+                        chunk,
+                        index,
+                        total_chunks,
+                        progress_percentage,
+                        outcome.__cause__ or outcome,
+                    )
+                    continue
+
+                results[index] = outcome
+                if self.progress_callback and completed_throttle.ready(
+                    progress_percentage, force=completed == total_chunks
+                ):
+                    self._report_chunk_done(
+                        chunk, index, total_chunks, progress_percentage, outcome
+                    )
 
             if errors:
+                errors.sort(key=lambda x: x[0])
                 error_msg = f"提取过程中发生 {len(errors)} 个错误"
                 logger.error(
-                    f"{error_msg}: {[cid for _, cid, _ in errors]}",
+                    "%s: %s",
+                    error_msg,
+                    [cid for _, cid, _ in errors],
                     extra={
                         "error_count": len(errors),
                         "errors": [(index, cid, str(e)) for index, cid, e in errors],
@@ -260,15 +400,20 @@ class LogExtractor:
                     details={"errors": [(index, cid, str(e)) for index, cid, e in errors]},
                 )
 
-            logger.info(f"批量提取完成，成功: {len(extractions)}/{len(chunks.chunks)} 个chunk")
+            extractions = [result for result in results if result is not None]
+            logger.info("批量提取完成，成功: %d/%d 个chunk", len(extractions), total_chunks)
 
             return extractions
 
         except ExtractionError:
             raise
         except Exception as e:
-            logger.error(f"批量提取失败: {e}", exc_info=True)
+            logger.error("批量提取失败: %s", e, exc_info=True)
             raise ExtractionError(f"批量提取失败: {e}") from e
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
 
     async def extract_from_log(
         self,
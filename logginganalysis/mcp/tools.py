@@ -1,23 +1,120 @@
 """MCP 工具定义。"""
 
+import threading
+from collections.abc import Callable
 from typing import Any
 
+import fastjsonschema
+from jsonschema.exceptions import ValidationError, best_match
+from jsonschema.protocols import Validator
+from jsonschema.validators import validator_for
 from mcp.types import Tool
 
 from logginganalysis.mcp.server import AVAILABLE_TOOLS
 
+# JSON Schema 类型对应的中文名称（用于错误消息）
+_TYPE_NAMES = {
+    "string": "字符串",
+    "boolean": "布尔值",
+    "number": "数字",
+    "array": "数组",
+}
+
+# 工具缓存：工具列表、按名称索引的工具及预编译的参数校验器，在模块导入时构建。
+# 构建时按 schema 声明的草案选择 jsonschema 校验器类并检查 schema 本身，
+# fastjsonschema 生成的校验函数用于快速判断参数是否有效，
+# jsonschema 校验器仅在参数无效时用于生成详细的错误消息。
+_TOOLS_CACHE: list[Tool] = []
+_TOOLS_BY_NAME: dict[str, Tool] = {}
+_VALIDATORS_BY_NAME: dict[str, Validator] = {}
+_COMPILED_VALIDATORS: dict[str, Callable[[Any], Any]] = {}
+_REQUIRED_BY_NAME: dict[str, frozenset[str]] = {}
+_CACHE_LOCK = threading.Lock()
+
+# 负缓存：记录查询过的未知工具名称，数量达到上限后不再增加
+_UNKNOWN_TOOLS: set[str] = set()
+_UNKNOWN_TOOLS_MAX_SIZE = 1024
+
+
+def _reload_tools() -> None:
+    """重新构建工具缓存（包括清空负缓存）。
+
+    先在局部变量中构建全部工具的查找表和校验器，所有 schema 都通过检查后才替换缓存；
+    schema 无效时抛出 SchemaError，原有缓存保持不变。
+    """
+    tools = list(AVAILABLE_TOOLS)
+    tools_by_name: dict[str, Tool] = {}
+    validators_by_name: dict[str, Validator] = {}
+    compiled_validators: dict[str, Callable[[Any], Any]] = {}
+    required_by_name: dict[str, frozenset[str]] = {}
+    for tool in tools:
+        tools_by_name[tool.name] = tool
+        schema = tool.inputSchema
+        if schema:
+            # 未声明 $schema 时默认使用 Draft 2020-12
+            validator_cls = validator_for(schema)
+            validator_cls.check_schema(schema)
+            validators_by_name[tool.name] = validator_cls(
+                schema, format_checker=validator_cls.FORMAT_CHECKER
+            )
+            compiled_validators[tool.name] = fastjsonschema.compile(schema)
+            required_by_name[tool.name] = frozenset(schema.get("required", ()))
+
+    with _CACHE_LOCK:
+        _TOOLS_BY_NAME.clear()
+        _TOOLS_BY_NAME.update(tools_by_name)
+        _VALIDATORS_BY_NAME.clear()
+        _VALIDATORS_BY_NAME.update(validators_by_name)
+        _COMPILED_VALIDATORS.clear()
+        _COMPILED_VALIDATORS.update(compiled_validators)
+        _REQUIRED_BY_NAME.clear()
+        _REQUIRED_BY_NAME.update(required_by_name)
+        _UNKNOWN_TOOLS.clear()
+        _TOOLS_CACHE[:] = tools
+
+
+_reload_tools()
+
 
 def get_tools() -> list[Tool]:
     """获取所有可用的 MCP 工具。"""
-    return AVAILABLE_TOOLS
+    return _TOOLS_CACHE
 
 
 def get_tool(name: str) -> Tool | None:
     """根据名称获取工具。"""
-    for tool in AVAILABLE_TOOLS:
-        if tool.name == name:
-            return tool
-    return None
+    tool = _TOOLS_BY_NAME.get(name)
+    if tool is not None:
+        return tool
+
+    # 未命中时加锁，避免与 _reload_tools 交错而把刚加载的工具记入负缓存
+    with _CACHE_LOCK:
+        if name in _UNKNOWN_TOOLS:
+            return None
+        tool = _TOOLS_BY_NAME.get(name)
+        if tool is None and len(_UNKNOWN_TOOLS) < _UNKNOWN_TOOLS_MAX_SIZE:
+            _UNKNOWN_TOOLS.add(name)
+        return tool
+
+
+def _format_validation_error(error: ValidationError) -> str:
+    """将 jsonschema 校验错误转换为错误消息。"""
+    param = error.path[0] if error.path else None
+    expected = error.validator_value
+
+    if error.validator == "required" and isinstance(expected, list):
+        instance = error.instance if isinstance(error.instance, dict) else {}
+        missing = [p for p in expected if p not in instance]
+        return f"缺少必需参数: {missing[0] if missing else error.message}"
+    if param is None:
+        return error.message
+    if error.validator == "type" and isinstance(expected, str):
+        type_name = _TYPE_NAMES.get(expected)
+        if type_name:
+            return f"参数 {param} 应该是{type_name}"
+    if error.validator == "enum":
+        return f"参数 {param} 的值无效，允许的值: {expected}"
+    return f"参数 {param} 无效: {error.message}"
 
 
 def validate_tool_arguments(name: str, arguments: dict[str, Any]) -> tuple[bool, str | None]:
@@ -34,35 +131,20 @@ def validate_tool_arguments(name: str, arguments: dict[str, Any]) -> tuple[bool,
     if tool is None:
         return False, f"未知的工具: {name}"
 
-    schema = tool.inputSchema
-    if not schema:
+    compiled = _COMPILED_VALIDATORS.get(name)
+    if compiled is None:
         return True, None
 
-    # 检查必需参数
-    required = schema.get("required", [])
-    for param in required:
-        if param not in arguments or not arguments[param]:
-            return False, f"缺少必需参数: {param}"
-
-    # 检查参数类型
-    properties = schema.get("properties", {})
-    for param, value in arguments.items():
-        if param in properties:
-            param_schema = properties[param]
-            param_type = param_schema.get("type")
-
-            # 简单类型检查
-            if param_type == "string" and not isinstance(value, str):
-                return False, f"参数 {param} 应该是字符串"
-            elif param_type == "boolean" and not isinstance(value, bool):
-                return False, f"参数 {param} 应该是布尔值"
-            elif param_type == "number" and not isinstance(value, (int, float)):
-                return False, f"参数 {param} 应该是数字"
-            elif param_type == "array" and not isinstance(value, list):
-                return False, f"参数 {param} 应该是数组"
-
-            # 检查枚举值
-            if "enum" in param_schema and value not in param_schema["enum"]:
-                return False, f"参数 {param} 的值无效，允许的值: {param_schema['enum']}"
+    # 检查必需参数（空值同样视为缺失），无需运行完整校验
+    required = _REQUIRED_BY_NAME[name]
+    missing = required.difference(arguments) or {p for p in required if not arguments[p]}
+    if missing:
+        return False, f"缺少必需参数: {', '.join(sorted(missing))}"
+
+    try:
+        compiled(arguments)
+    except fastjsonschema.JsonSchemaException as e:
+        error = best_match(_VALIDATORS_BY_NAME[name].iter_errors(arguments))
+        return False, _format_validation_error(error) if error is not None else str(e)
 
     return True, None
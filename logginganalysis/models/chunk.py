@@ -1,10 +1,18 @@
 """日志块数据模型。"""
 
+import secrets
 from typing import Any
-from uuid import uuid4
 
 from pydantic import BaseModel, ConfigDict, Field
 
+# 日志块标识的随机字节数（8 字节，即 16 个十六进制字符）
+_CHUNK_ID_BYTES = 8
+
+
+def _new_chunk_id() -> str:
+    """生成日志块唯一标识（16 位十六进制字符串）。"""
+    return secrets.token_hex(_CHUNK_ID_BYTES)
+
 
 class LogChunk(BaseModel):
     """日志块模型。
@@ -12,22 +20,23 @@ class LogChunk(BaseModel):
     表示日志内容的一个分块。
     """
 
-    id: str = Field(default_factory=lambda: str(uuid4()), description="日志块唯一标识")
+    id: str = Field(default_factory=_new_chunk_id, description="日志块唯一标识")
     content: str = Field(..., description="日志块内容")
     start_index: int = Field(..., description="在原始日志中的起始位置")
     end_index: int = Field(..., description="在原始日志中的结束位置")
     metadata: dict[str, Any] = Field(default_factory=dict, description="额外的元数据")
 
     model_config = ConfigDict(
+        frozen=True,
         json_schema_extra={
             "example": {
-                "id": "550e8400-e29b-41d4-a716-446655440000",
+                "id": "3f2a9c1e7b4d6a08",
                 "content": "2025-12-31 10:00:00 INFO Starting application...",
                 "start_index": 0,
                 "end_index": 50,
                 "metadata": {"timestamp": "2025-12-31T10:00:00"},
             }
-        }
+        },
     )
 
 
@@ -46,7 +55,7 @@ class LogChunks(BaseModel):
             "example": {
                 "chunks": [
                     {
-                        "id": "550e8400-e29b-41d4-a716-446655440000",
+                        "id": "3f2a9c1e7b4d6a08",
                         "content": "2025-12-31 10:00:00 INFO Starting application...",
                         "start_index": 0,
                         "end_index": 50,
@@ -4,6 +4,54 @@ from typing import Literal
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
+# 常见的类别/类型取值，各块中重复出现时共享这里的同一个字符串对象。
+# 只收录固定的已知值：对任意模型输出调用 sys.intern 会使其常驻内存。
+_KNOWN_EXCEPTION_TYPES = {
+    t: t
+    for t in (
+        "Exception",
+        "RuntimeError",
+        "ValueError",
+        "TypeError",
+        "KeyError",
+        "IndexError",
+        "AttributeError",
+        "ImportError",
+        "ModuleNotFoundError",
+        "OSError",
+        "FileNotFoundError",
+        "PermissionError",
+        "ConnectionError",
+        "TimeoutError",
+        "MemoryError",
+        "NullPointerException",
+        "IllegalArgumentException",
+        "IllegalStateException",
+        "ClassNotFoundException",
+        "NoClassDefFoundError",
+        "OutOfMemoryError",
+        "StackOverflowError",
+    )
+}
+_KNOWN_LIBRARY_TYPES = {t: t for t in ("mod", "framework", "library")}
+_KNOWN_CATEGORIES = {
+    c: c
+    for c in (
+        "database",
+        "network",
+        "memory",
+        "performance",
+        "native_library",
+        "security",
+        "launch_tweaking",
+    )
+}
+
+
+def _canonical(v: str, known: dict[str, str]) -> str:
+    """已知取值返回共享的字符串对象，其他值原样返回。"""
+    return known.get(v, v)
+
 
 class ExceptionInfo(BaseModel):
     """异常信息模型。
@@ -27,7 +75,14 @@ class ExceptionInfo(BaseModel):
             return "\n".join(v)
         return v
 
+    @field_validator("type")
+    @classmethod
+    def canonicalize_type(cls, v: str) -> str:
+        """常见异常类型共享同一个字符串对象。"""
+        return _canonical(v, _KNOWN_EXCEPTION_TYPES)
+
     model_config = ConfigDict(
+        frozen=True,
         json_schema_extra={
             "example": {
                 "type": "ConnectionError",
@@ -35,7 +90,7 @@ class ExceptionInfo(BaseModel):
                 "stack_trace": "Traceback (most recent call last)...",
                 "occurrence_count": 3,
             }
-        }
+        },
     )
 
 
@@ -52,14 +107,21 @@ class LibraryReference(BaseModel):
     type: str | None = Field(default=None, description="库类型 (如 mod, framework, library 等)")
     source: str | None = Field(default=None, description="来源信息")
 
+    @field_validator("type")
+    @classmethod
+    def canonicalize_type(cls, v: str | None) -> str | None:
+        """常见库类型共享同一个字符串对象。"""
+        return v if v is None else _canonical(v, _KNOWN_LIBRARY_TYPES)
+
     model_config = ConfigDict(
+        frozen=True,
         json_schema_extra={
             "example": {
                 "name": "FastAPI",
                 "version": "0.104.1",
                 "context": "INFO: Started server process [1234] using Uvicorn",
             }
-        }
+        },
     )
 
 
@@ -91,7 +153,14 @@ class ProblematicBehavior(BaseModel):
             return "low"
         return v
 
+    @field_validator("category")
+    @classmethod
+    def canonicalize_category(cls, v: str | None) -> str | None:
+        """常见问题类别共享同一个字符串对象。"""
+        return v if v is None else _canonical(v, _KNOWN_CATEGORIES)
+
     model_config = ConfigDict(
+        frozen=True,
         json_schema_extra={
             "example": {
                 "category": "database",
@@ -102,7 +171,7 @@ class ProblematicBehavior(BaseModel):
                     "2025-12-31 10:00:05 ERROR Database connection failed: timeout",
                 ],
             }
-        }
+        },
     )
 
 
@@ -123,9 +192,10 @@ class ChunkExtractionResult(BaseModel):
     summary: str = Field(..., description="该块的简要总结")
 
     model_config = ConfigDict(
+        frozen=True,
         json_schema_extra={
             "example": {
-                "chunk_id": "550e8400-e29b-41d4-a716-446655440000",
+                "chunk_id": "3f2a9c1e7b4d6a08",
                 "exceptions": [
                     {
                         "type": "ConnectionError",
@@ -151,5 +221,5 @@ class ChunkExtractionResult(BaseModel):
                 ],
                 "summary": "Chunk contains database connection issues and FastAPI startup logs.",
             }
-        }
+        },
     )
@@ -2,10 +2,22 @@
 
 from abc import ABC, abstractmethod
 from datetime import datetime
+from functools import cache
 from typing import Any, Literal
 
 from logginganalysis.models.report import AnalysisReport
 
+# 严重程度推断关键词
+_CRITICAL_KEYWORDS = ("crash", "fatal", "security", "breach", "数据泄露")
+_HIGH_KEYWORDS = ("failure", "timeout", "error", "性能")
+_MEDIUM_KEYWORDS = ("warning", "慢", "延迟")
+
+# 预先生成的置信度条（索引为已填充格数，0-20）
+_CONFIDENCE_BAR_WIDTH = 20
+_CONFIDENCE_BARS = tuple(
+    "█" * i + "░" * (_CONFIDENCE_BAR_WIDTH - i) for i in range(_CONFIDENCE_BAR_WIDTH + 1)
+)
+
 
 class ReportFormatter(ABC):
     """报告格式化器基类。"""
@@ -23,6 +35,22 @@ class ReportFormatter(ABC):
         pass
 
 
+# Markdown 报告开头的固定部分（标题、元数据、整体摘要、置信度）
+_MARKDOWN_HEADER_TEMPLATE = (
+    "# 日志分析报告\n\n"
+    "## 分析元数据\n\n"
+    "- **生成时间**: {generated_at}\n"
+    "{log_source_line}"
+    "- **日志大小**: {log_size}\n"
+    "- **分块数量**: {chunk_count}\n"
+    "- **处理耗时**: {processing_time:.2f}秒\n"
+    "- **使用模型**: {models}\n\n"
+    "## 整体摘要\n\n"
+    "{summary}\n\n"
+    "**分析置信度**: {confidence_bar} ({confidence:.0%})\n"
+)
+
+
 class MarkdownFormatter(ReportFormatter):
     """Markdown 格式化器。"""
 
@@ -35,41 +63,38 @@ class MarkdownFormatter(ReportFormatter):
         Returns:
             str: Markdown 格式的报告
         """
-        lines = []
-
-        # 标题
-        lines.append("# 日志分析报告\n")
-
-        # 元数据
-        lines.append("## 分析元数据\n")
-        lines.append(f"- **生成时间**: {self._format_datetime(report.generated_at)}")
-        if report.metadata.log_source:
-            lines.append(f"- **日志来源**: {report.metadata.log_source}")
-        lines.append(f"- **日志大小**: {self._format_size(report.metadata.log_size_bytes)}")
-        lines.append(f"- **分块数量**: {report.metadata.chunk_count}")
-        lines.append(f"- **处理耗时**: {report.metadata.processing_time_seconds:.2f}秒")
-        lines.append(f"- **使用模型**: {', '.join(report.metadata.models_used.values())}\n")
-
-        # 整体摘要
-        lines.append("## 整体摘要\n")
-        lines.append(report.analysis.overall_summary)
-        lines.append("")
-
-        # 置信度
-        confidence_bar = self._create_confidence_bar(report.analysis.confidence_score)
-        lines.append(f"**分析置信度**: {confidence_bar} ({report.analysis.confidence_score:.0%})\n")
+        metadata = report.metadata
+        analysis = report.analysis
+
+        # 标题、元数据、整体摘要和置信度一次性渲染
+        lines = [
+            _MARKDOWN_HEADER_TEMPLATE.format_map(
+                {
+                    "generated_at": self._format_datetime(report.generated_at),
+                    "log_source_line": (
+                        f"- **日志来源**: {metadata.log_source}\n" if metadata.log_source else ""
+                    ),
+                    "log_size": self._format_size(metadata.log_size_bytes),
+                    "chunk_count": metadata.chunk_count,
+                    "processing_time": metadata.processing_time_seconds,
+                    "models": ", ".join(metadata.models_used.values()),
+                    "summary": analysis.overall_summary,
+                    "confidence_bar": self._create_confidence_bar(analysis.confidence_score),
+                    "confidence": analysis.confidence_score,
+                }
+            )
+        ]
 
         # 系统环境
-        if report.analysis.system_context:
+        if analysis.system_context:
             lines.append("## 系统环境\n")
-            for key, value in report.analysis.system_context.items():
-                lines.append(f"- **{key}**: {value}")
+            lines.extend(f"- **{key}**: {value}" for key, value in analysis.system_context.items())
             lines.append("")
 
         # 关键发现
-        if report.analysis.key_findings:
+        if analysis.key_findings:
             lines.append("## 关键发现\n")
-            for i, finding in enumerate(report.analysis.key_findings, 1):
+            for i, finding in enumerate(analysis.key_findings, 1):
                 lines.append(f"### {i}. {finding.category}\n")
                 lines.append(f"{finding.description}\n")
 
@@ -81,21 +106,19 @@ class MarkdownFormatter(ReportFormatter):
                 # 证据
                 if finding.evidence:
                     lines.append("**证据**:")
-                    for evidence in finding.evidence:
-                        lines.append(f"  - {evidence}")
+                    lines.extend(f"  - {evidence}" for evidence in finding.evidence)
                     lines.append("")
 
                 # 建议
                 if finding.recommendations:
                     lines.append("**建议**:")
-                    for rec in finding.recommendations:
-                        lines.append(f"  1. {rec}")
+                    lines.extend(f"  1. {rec}" for rec in finding.recommendations)
                     lines.append("")
 
         # 根因分析
-        if report.analysis.root_cause_analysis:
+        if analysis.root_cause_analysis:
             lines.append("## 根因分析\n")
-            lines.append(report.analysis.root_cause_analysis)
+            lines.append(analysis.root_cause_analysis)
             lines.append("")
 
         # 原始提取摘要
@@ -140,27 +163,19 @@ class MarkdownFormatter(ReportFormatter):
 
     def _create_confidence_bar(self, score: float) -> str:
         """创建置信度条。"""
-        filled = int(score * 20)
-        bar = "█" * filled + "░" * (20 - filled)
-        return bar
+        filled = int(score * _CONFIDENCE_BAR_WIDTH)
+        return _CONFIDENCE_BARS[min(_CONFIDENCE_BAR_WIDTH, max(0, filled))]
 
     def _infer_severity(self, finding: Any) -> str | None:
         """推断发现的严重程度。"""
-        from logginganalysis.models.integration import AnalysisInsight
+        # 基于类别和描述中的关键词推断严重程度（关键词不含换行，拼接后不会跨字段误匹配）
+        text = f"{finding.category or ''}\n{finding.description or ''}".lower()
 
-        # 基于类别关键词推断严重程度
-        critical_keywords = ["crash", "fatal", "security", "breach", "数据泄露"]
-        high_keywords = ["failure", "timeout", "error", "性能"]
-        medium_keywords = ["warning", "慢", "延迟"]
-
-        category_lower = (finding.category or "").lower()
-        desc_lower = (finding.description or "").lower()
-
-        if any(kw in category_lower or kw in desc_lower for kw in critical_keywords):
+        if any(kw in text for kw in _CRITICAL_KEYWORDS):
             return "🔴 严重"
-        elif any(kw in category_lower or kw in desc_lower for kw in high_keywords):
+        elif any(kw in text for kw in _HIGH_KEYWORDS):
             return "🟠 高"
-        elif any(kw in category_lower or kw in desc_lower for kw in medium_keywords):
+        elif any(kw in text for kw in _MEDIUM_KEYWORDS):
             return "🟡 中"
         else:
             return "🟢 低"
@@ -172,6 +187,8 @@ class JSONFormatter(ReportFormatter):
     def format(self, report: AnalysisReport) -> str:
         """将报告格式化为 JSON。
 
+        直接由 pydantic-core 序列化模型，不经过 model_dump() 构建中间字典。
+
         Args:
             report: 分析报告
 
@@ -227,8 +244,7 @@ class TextFormatter(ReportFormatter):
                 lines.append(f"     {finding.description}")
                 if finding.recommendations:
                     lines.append("     建议:")
-                    for rec in finding.recommendations:
-                        lines.append(f"       - {rec}")
+                    lines.extend(f"       - {rec}" for rec in finding.recommendations)
             lines.append("")
 
         lines.append("=" * 60)
@@ -239,24 +255,27 @@ class TextFormatter(ReportFormatter):
 # 支持的格式类型
 OutputFormat = Literal["markdown", "json", "text"]
 
+_FORMATTER_CLASSES: dict[str, type[ReportFormatter]] = {
+    "markdown": MarkdownFormatter,
+    "json": JSONFormatter,
+    "text": TextFormatter,
+}
 
+
+@cache
 def get_formatter(format_type: OutputFormat = "markdown") -> ReportFormatter:
     """获取指定类型的格式化器。
 
+    格式化器无状态，每种格式在进程内只创建一个实例。
+
     Args:
         format_type: 格式类型
 
     Returns:
         ReportFormatter: 对应的格式化器
     """
-    formatters = {
-        "markdown": MarkdownFormatter(),
-        "json": JSONFormatter(),
-        "text": TextFormatter(),
-    }
-
-    formatter = formatters.get(format_type)
-    if formatter is None:
+    formatter_cls = _FORMATTER_CLASSES.get(format_type)
+    if formatter_cls is None:
         raise ValueError(f"不支持的格式类型: {format_type}")
 
-    return formatter
+    return formatter_cls()
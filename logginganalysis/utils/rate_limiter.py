@@ -4,9 +4,14 @@
 """
 
 import asyncio
+import math
 import time
+from array import array
+from bisect import bisect_right
 from collections import deque
-from dataclasses import dataclass, field
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from itertools import accumulate
 from typing import Any
 
 
@@ -18,6 +23,139 @@ class RateLimitConfig:
     rpm_limit: int | None = None  # RPM (每分钟请求数) 限制
     burst_size: int = 10  # 突发容量
     enabled: bool = True  # 是否启用流控
+    shards: int = 1  # 分片数：限制分摊到各分片，每个任务优先使用固定的一个分片
+
+
+# 滑动窗口划分的时间桶数量
+_BUCKETS_PER_WINDOW = 60
+
+# 单个桶的请求数不超过 limit，limit 在 32 位范围内时用 32 位无符号整数存储
+_UINT32_MAX = 0xFFFFFFFF
+
+# 选择分片时用于打散任务哈希的乘数（黄金分割常数），任务对象地址按固定步长分配，
+# 直接取模会集中到少数分片
+_SHARD_HASH_MULTIPLIER = 0x9E3779B97F4A7C15
+
+
+def _loop_time() -> float:
+    """获取当前事件循环的时间。
+
+    与 asyncio 定时器使用同一个单调时钟（标准事件循环中即 time.monotonic()），
+    据此计算的等待时间与 loop.call_later 的调度一致。没有运行中的事件循环时
+    返回 time.monotonic()。
+    """
+    try:
+        return asyncio.get_running_loop().time()
+    except RuntimeError:
+        return time.monotonic()
+
+
+def _split_evenly(total: int, shards: int) -> list[int]:
+    """将 total 分摊到各分片，余数分给前面的分片，各分片之和等于 total。"""
+    base, remainder = divmod(total, shards)
+    return [base + (i < remainder) for i in range(shards)]
+
+
+def _current_shard(shards: int) -> int:
+    """根据当前任务选择分片编号（不在事件循环中时固定为同一分片）。"""
+    try:
+        task = asyncio.current_task()
+    except RuntimeError:
+        task = None
+    return (hash(task) * _SHARD_HASH_MULTIPLIER >> 32) % shards
+
+
+def _wake(future: asyncio.Future[None]) -> None:
+    """唤醒尚未完成的 future。"""
+    if not future.done():
+        future.set_result(None)
+
+
+class _WaitQueue:
+    """按先后顺序唤醒等待者的队列。
+
+    由单个调度任务为队首等待者重试获取，失败时等待一个由 loop.call_later
+    触发的 future 到预计可以获取的时间，等待者各自无需定时重试。
+    """
+
+    def __init__(self, try_acquire: Callable[[int], float | None]) -> None:
+        """初始化等待队列。
+
+        Args:
+            try_acquire: 尝试获取的函数，成功时返回 None，否则返回预计可以获取的时间
+        """
+        self._try_acquire = try_acquire
+        self._waiters: deque[tuple[int, asyncio.Future[None]]] = deque()
+        self._dispatcher: asyncio.Task[None] | None = None
+        # 调度任务的唤醒信号，由定时器或 wake() 触发
+        self._wakeup: asyncio.Future[None] | None = None
+
+    async def wait(self, tokens: int) -> None:
+        """获取成功后返回；有其他等待者或获取失败时排队等待。
+
+        Args:
+            tokens: 需要的令牌数
+        """
+        if self._waiters:
+            next_at = None
+        elif (next_at := self._try_acquire(tokens)) is None:
+            return
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append((tokens, waiter))
+        if self._dispatcher is None or self._dispatcher.done():
+            self._dispatcher = asyncio.create_task(self._dispatch(next_at))
+        await waiter
+
+    def wake(self) -> None:
+        """立即唤醒调度任务重试（例如归还令牌后）。"""
+        if self._wakeup is not None:
+            _wake(self._wakeup)
+
+    async def _dispatch(self, next_at: float | None) -> None:
+        """按先后顺序为等待者获取并唤醒，队列为空时退出。
+
+        Args:
+            next_at: 队首等待者预计可以获取的时间，None 表示立即尝试
+        """
+        waiters = self._waiters
+        try:
+            while waiters:
+                if next_at is not None:
+                    await self._wait_until(next_at)
+
+                tokens, waiter = waiters[0]
+                if waiter.done():
+                    # 等待者已取消
+                    waiters.popleft()
+                    next_at = None
+                    continue
+
+                next_at = self._try_acquire(tokens)
+                if next_at is None:
+                    waiters.popleft()
+                    waiter.set_result(None)
+        except asyncio.CancelledError:
+            while waiters:
+                waiters.popleft()[1].cancel()
+            raise
+
+    async def _wait_until(self, deadline: float) -> None:
+        """等待到事件循环时间 deadline（最长 1 秒），wake() 可提前唤醒。
+
+        只使用一个定时器和 future，无需经过 asyncio.sleep 的协程包装。
+
+        Args:
+            deadline: 预计可以获取的事件循环时间
+        """
+        loop = asyncio.get_running_loop()
+        wakeup = self._wakeup = loop.create_future()
+        handle = loop.call_later(min(max(0.0, deadline - loop.time()), 1), _wake, wakeup)
+        try:
+            await wakeup
+        finally:
+            handle.cancel()
+            self._wakeup = None
 
 
 class TokenBucket:
@@ -36,93 +174,240 @@ class TokenBucket:
         self.rate = rate  # 令牌/分钟
         self.burst = float(burst)  # 最大桶容量
         self.tokens = float(burst)  # 当前令牌数
-        self.last_update = time.time()
-        self._lock = asyncio.Lock()
+        # 上次补充的事件循环时间，首次获取时才记录，避免与构造时所用的时钟不一致
+        self.last_update: float | None = None
+
+        # 预先换算为每秒速率及每个令牌所需秒数，避免每次补充时做除法
+        self._rate_per_sec = rate / 60.0
+        self._sec_per_token = 60.0 / rate if rate else math.inf
+
+        # 令牌充足时，距上次补充不足该间隔（秒）则跳过补充；经过的时间会计入下一次补充
+        self._min_refill_interval = 1e-3
+
+        # 等待令牌的协程按先后顺序排队，release() 归还令牌时提前唤醒
+        self._queue = _WaitQueue(self.try_acquire_or_next)
 
     async def acquire(self, tokens: int = 1) -> bool:
         """获取令牌。
 
+        补充和扣减之间没有 await，在事件循环中不会被其他协程打断，因此无需加锁。
+
         Args:
             tokens: 需要的令牌数量
 
         Returns:
             bool: 是否成功获取令牌
         """
-        async with self._lock:
-            now = time.time()
-            elapsed = now - self.last_update
+        return self.try_acquire_or_next(tokens) is None
+
+    def try_acquire_or_next(self, tokens: int = 1) -> float | None:
+        """尝试获取令牌，失败时返回可以获取的时间。
+
+        同步方法，可在事件循环之外调用。
 
-            # 补充令牌
-            refill_amount = (elapsed / 60) * self.rate
-            self.tokens = min(self.burst, self.tokens + refill_amount)
+        Args:
+            tokens: 需要的令牌数量
+
+        Returns:
+            float | None: 成功时返回 None，否则返回令牌足够时的事件循环时间
+        """
+        now = _loop_time()
+        available = self.tokens
+        if self.last_update is None:
+            self.last_update = now
+
+        # 令牌不足或距上次补充已超过最小间隔时，按经过的时间补充令牌
+        elapsed = now - self.last_update
+        if available < tokens or elapsed >= self._min_refill_interval:
+            if elapsed > 0:
+                available = min(self.burst, available + elapsed * self._rate_per_sec)
             self.last_update = now
 
-            # 检查是否有足够令牌
-            if self.tokens >= tokens:
-                self.tokens -= tokens
-                return True
+        # 检查是否有足够令牌
+        if available >= tokens:
+            self.tokens = available - tokens
+            return None
 
-            return False
+        self.tokens = available
+        return now + (tokens - available) * self._sec_per_token
+
+    def acquire_many(self, costs: Sequence[int]) -> int:
+        """按顺序为一批请求获取令牌，只补充一次令牌。
+
+        Args:
+            costs: 各请求需要的令牌数
+
+        Returns:
+            int: 获得令牌的请求数（costs 的前若干项）
+        """
+        now = _loop_time()
+        elapsed = now - self.last_update if self.last_update is not None else 0.0
+        if elapsed > 0:
+            self.tokens = min(self.burst, self.tokens + elapsed * self._rate_per_sec)
+        self.last_update = now
+
+        # 累计令牌数不超过当前令牌数的前缀即可放行
+        cumulative = list(accumulate(costs))
+        admitted = bisect_right(cumulative, self.tokens)
+        if admitted:
+            self.tokens -= cumulative[admitted - 1]
+        return admitted
+
+    def release(self, tokens: int = 1) -> None:
+        """归还已获取的令牌（不超过桶容量）。
+
+        Args:
+            tokens: 归还的令牌数量
+        """
+        self.tokens = min(self.burst, self.tokens + tokens)
+        self._queue.wake()
 
     async def wait_for_token(self, tokens: int = 1) -> None:
         """等待直到可以获取令牌。
 
+        没有其他等待者且令牌足够时直接返回，否则按先后顺序排队等待。
+
         Args:
             tokens: 需要的令牌数量
         """
-        while not await self.acquire(tokens):
-            # 计算需要等待的时间
-            wait_time = (tokens - self.tokens) * 60 / self.rate
-            await asyncio.sleep(max(0.1, min(wait_time, 1)))
+        await self._queue.wait(tokens)
 
 
 class SlidingWindow:
     """滑动窗口算法实现流控。
 
-    适用于 TPM (每分钟事务数) 流控。
+    适用于 TPM (每分钟事务数) 流控。将窗口划分为固定数量的时间桶，各桶的请求数保存在
+    按桶编号取模索引的环形数组中，内存占用与 limit 无关；请求最多提前一个桶的时长
+    （窗口的 1/60）过期。
     """
 
     def __init__(self, limit: int, window: int = 60) -> None:
         """初始化滑动窗口。
 
         Args:
-            limit: 时间窗口内的最大请求数
+            limit: 时间窗口内的最大请求数，至少为 1
             window: 时间窗口大小（秒），默认 60 秒
+
+        Raises:
+            ValueError: limit 小于 1 时抛出（永远不会放行，等待者会空转）
         """
+        if limit < 1:
+            raise ValueError(f"limit must be at least 1, got {limit}")
         self.limit = limit
         self.window = window
-        self.requests: deque[float] = deque()
-        self._lock = asyncio.Lock()
+        self._bucket_size = window / _BUCKETS_PER_WINDOW  # 默认 60 秒窗口时每桶 1 秒
+        typecode = "I" if limit <= _UINT32_MAX else "Q"
+        self._counts = array(typecode, [0]) * _BUCKETS_PER_WINDOW  # 第 b 个桶位于 b % 60
+        self._newest = -_BUCKETS_PER_WINDOW  # 环形数组中最新的桶编号
+        self._total = 0  # 窗口内各桶的请求数之和
+
+        # 等待插槽的协程按先后顺序排队
+        self._queue = _WaitQueue(lambda tokens: self.try_acquire_or_next())
+
+    def __len__(self) -> int:
+        """滑动窗口内的请求数。"""
+        self._evict(int(_loop_time() / self._bucket_size))
+        return self._total
+
+    def _evict(self, bucket: int) -> None:
+        """将环形数组推进到当前桶，清空其间已离开窗口的桶。
+
+        Args:
+            bucket: 当前时间所在的桶编号
+        """
+        newest = self._newest
+        if bucket <= newest:
+            return
+
+        counts = self._counts
+        if bucket - newest >= _BUCKETS_PER_WINDOW:
+            counts[:] = array(counts.typecode, [0]) * _BUCKETS_PER_WINDOW
+            self._total = 0
+        else:
+            for b in range(newest + 1, bucket + 1):
+                slot = b % _BUCKETS_PER_WINDOW
+                self._total -= counts[slot]
+                counts[slot] = 0
+        self._newest = bucket
+
+    def _try_admit(self, now: float) -> bool:
+        """窗口未满时记录一次请求。
+
+        Args:
+            now: 当前时间（事件循环时间）
+
+        Returns:
+            bool: 是否允许请求
+        """
+        bucket = int(now / self._bucket_size)
+        self._evict(bucket)
+        if self._total >= self.limit:
+            return False
+
+        self._counts[bucket % _BUCKETS_PER_WINDOW] += 1
+        self._total += 1
+        return True
+
+    def acquire_many(self, count: int) -> int:
+        """为一批请求记录窗口内剩余的配额。
+
+        Args:
+            count: 请求数
+
+        Returns:
+            int: 获得许可的请求数
+        """
+        bucket = int(_loop_time() / self._bucket_size)
+        self._evict(bucket)
+        admitted = max(0, min(count, self.limit - self._total))
+        self._counts[bucket % _BUCKETS_PER_WINDOW] += admitted
+        self._total += admitted
+        return admitted
+
+    def _seconds_until_slot(self, now: float) -> float:
+        """计算窗口内请求数降到限制以下还需等待的秒数。"""
+        # 先清空已过期的桶，避免按过期的请求数计算
+        self._evict(int(now / self._bucket_size))
+        excess = self._total - self.limit
+        if excess < 0:
+            return 0.0
+
+        counts = self._counts
+        for bucket in range(self._newest - _BUCKETS_PER_WINDOW + 1, self._newest + 1):
+            excess -= counts[bucket % _BUCKETS_PER_WINDOW]
+            if excess < 0:
+                return max(0.0, (bucket + _BUCKETS_PER_WINDOW) * self._bucket_size - now)
+        return 0.0
 
     async def acquire(self) -> bool:
         """检查是否允许请求。
 
+        检查和记录之间没有 await，在事件循环中不会被其他协程打断，因此无需加锁。
+
         Returns:
             bool: 是否允许请求
         """
-        async with self._lock:
-            now = time.time()
+        return self.try_acquire_or_next() is None
 
-            # 移除窗口外的请求
-            while self.requests and self.requests[0] <= now - self.window:
-                self.requests.popleft()
+    def try_acquire_or_next(self) -> float | None:
+        """尝试记录一次请求，失败时返回可以发送请求的时间。
 
-            # 检查是否超过限制
-            if len(self.requests) < self.limit:
-                self.requests.append(now)
-                return True
+        同步方法，可在事件循环之外调用。
 
-            return False
+        Returns:
+            float | None: 成功时返回 None，否则返回出现空闲插槽时的事件循环时间
+        """
+        now = _loop_time()
+        if self._try_admit(now):
+            return None
+        return now + self._seconds_until_slot(now)
 
     async def wait_for_slot(self) -> None:
-        """等待直到可以发送请求。"""
-        while not await self.acquire():
-            # 计算需要等待的时间（最旧请求过期时间）
-            if self.requests:
-                wait_time = self.requests[0] + self.window - time.time()
-                await asyncio.sleep(max(0.1, min(wait_time, 1)))
-            else:
-                await asyncio.sleep(0.1)
+        """等待直到可以发送请求。
+
+        窗口已满时按先后顺序排队，在最早的桶过期时被唤醒。
+        """
+        await self._queue.wait(1)
 
 
 class RateLimiter:
@@ -142,22 +427,131 @@ class RateLimiter:
         """
         self.config = config or RateLimitConfig()
 
-        # 初始化流控器
-        self._rpm_limiter: TokenBucket | None = None
-        self._tpm_limiter: SlidingWindow | None = None
+        # 初始化流控器，分片时将各限制和突发容量分摊到各分片
+        shards = self.config.shards
+        if shards < 1:
+            raise ValueError(f"shards must be at least 1, got {shards}")
+        self._rpm_shards: list[TokenBucket] = []
+        self._tpm_shards: list[SlidingWindow] = []
 
         if self.config.enabled:
             if self.config.rpm_limit:
-                self._rpm_limiter = TokenBucket(
-                    rate=self.config.rpm_limit,
-                    burst=self.config.burst_size,
-                )
+                if shards > 1 and shards > min(self.config.rpm_limit, self.config.burst_size):
+                    raise ValueError(f"shards ({shards}) must not exceed rpm_limit or burst_size")
+                self._rpm_shards = [
+                    TokenBucket(rate=rate, burst=burst)
+                    for rate, burst in zip(
+                        _split_evenly(self.config.rpm_limit, shards),
+                        _split_evenly(self.config.burst_size, shards),
+                        strict=True,
+                    )
+                ]
 
             if self.config.tpm_limit:
-                self._tpm_limiter = SlidingWindow(
-                    limit=self.config.tpm_limit,
-                    window=60,
-                )
+                if shards > 1 and shards > self.config.tpm_limit:
+                    raise ValueError(f"shards ({shards}) must not exceed tpm_limit")
+                self._tpm_shards = [
+                    SlidingWindow(limit=limit, window=60)
+                    for limit in _split_evenly(self.config.tpm_limit, shards)
+                ]
+
+        # 第一个分片（未分片时即唯一的限制器）
+        self._rpm_limiter = self._rpm_shards[0] if self._rpm_shards else None
+        self._tpm_limiter = self._tpm_shards[0] if self._tpm_shards else None
+
+        # 禁用或未配置任何限制时，所有请求直接放行
+        self._unlimited = self._rpm_limiter is None and self._tpm_limiter is None
+        # 按配置预先选定的实现，热路径上无需再判断各限制是否启用
+        self._try_impl = self._make_sharded_try_acquire(shards)
+        # 等待许可的协程按先后顺序排队；通过实例属性调用 try_acquire_or_next，
+        # 子类重写或测试替换后同样生效
+        self._queue = _WaitQueue(lambda tokens: self.try_acquire_or_next(tokens))
+
+    def _make_sharded_try_acquire(self, shards: int) -> Callable[[int], float | None]:
+        """构造按当前任务选择分片的 try_acquire_or_next 实现。
+
+        先尝试当前任务的分片，不足时依次尝试其他分片，所有分片都不足时才拒绝，
+        因此分片后的总体限制与未分片时相同。
+
+        Args:
+            shards: 分片数
+
+        Returns:
+            Callable: 接收令牌数，成功时返回 None，否则返回可以获得许可的时间
+        """
+        shard_impls = [
+            self._make_try_acquire(
+                self._rpm_shards[i] if self._rpm_shards else None,
+                self._tpm_shards[i] if self._tpm_shards else None,
+            )
+            for i in range(shards)
+        ]
+        if shards == 1 or self._unlimited:
+            return shard_impls[0]
+
+        def try_sharded(tokens: int = 1) -> float | None:
+            home = _current_shard(shards)
+            earliest = math.inf
+            for offset in range(shards):
+                next_at = shard_impls[(home + offset) % shards](tokens)
+                if next_at is None:
+                    return None
+                earliest = min(earliest, next_at)
+            return earliest
+
+        return try_sharded
+
+    @staticmethod
+    def _make_try_acquire(
+        rpm_limiter: TokenBucket | None,
+        tpm_limiter: SlidingWindow | None,
+    ) -> Callable[[int], float | None]:
+        """根据启用的限制构造单个分片的 try_acquire_or_next 实现。
+
+        各限制器作为闭包变量捕获，调用时无需读取实例属性。
+
+        Args:
+            rpm_limiter: RPM 令牌桶，未启用时为 None
+            tpm_limiter: TPM 滑动窗口，未启用时为 None
+
+        Returns:
+            Callable: 接收令牌数，成功时返回 None，否则返回可以获得许可的时间
+        """
+        if rpm_limiter is None and tpm_limiter is None:
+
+            def try_unlimited(tokens: int = 1) -> float | None:
+                return None
+
+            return try_unlimited
+
+        if tpm_limiter is None:
+            return rpm_limiter.try_acquire_or_next  # type: ignore[union-attr]
+
+        tpm_try = tpm_limiter.try_acquire_or_next
+        if rpm_limiter is None:
+
+            def try_tpm_only(tokens: int = 1) -> float | None:
+                return tpm_try()
+
+            return try_tpm_only
+
+        rpm_try = rpm_limiter.try_acquire_or_next
+        rpm_release = rpm_limiter.release
+
+        def try_rpm_and_tpm(tokens: int = 1) -> float | None:
+            # 检查 RPM 限制
+            rpm_next = rpm_try(tokens)
+            if rpm_next is not None:
+                now = _loop_time()
+                return max(rpm_next, now + tpm_limiter._seconds_until_slot(now))
+
+            # 检查 TPM 限制，未通过时归还已获取的 RPM 令牌
+            tpm_next = tpm_try()
+            if tpm_next is not None:
+                rpm_release(tokens)
+            return tpm_next
+
+        return try_rpm_and_tpm
 
     async def acquire(self, tokens: int = 1) -> bool:
         """尝试获取流控许可。
@@ -168,20 +562,72 @@ class RateLimiter:
         Returns:
             bool: 是否获得许可
         """
-        if not self.config.enabled:
+        if self._unlimited:
             return True
+        return self._try_impl(tokens) is None
 
-        # 检查 RPM 限制
-        if self._rpm_limiter:
-            if not await self._rpm_limiter.acquire(tokens):
-                return False
+    def try_acquire_or_next(self, tokens: int = 1) -> float | None:
+        """尝试获取流控许可，失败时返回可以获得许可的时间。
 
-        # 检查 TPM 限制
-        if self._tpm_limiter:
-            if not await self._tpm_limiter.acquire():
-                return False
+        同步方法，可在事件循环之外调用。
 
-        return True
+        Args:
+            tokens: 需要的令牌数（用于 RPM）
+
+        Returns:
+            float | None: 成功时返回 None，否则返回各限制都允许时的事件循环时间
+        """
+        return self._try_impl(tokens)
+
+    def acquire_many(self, count: int, tokens_each: int = 1) -> int:
+        """为一批请求获取流控许可，每个分片的各限制只检查一次。
+
+        先从当前任务的分片获取，不足的部分依次从其他分片获取；
+        TPM 限制放行的请求少于 RPM 时，归还多获取的 RPM 令牌。
+
+        Args:
+            count: 请求数
+            tokens_each: 每个请求需要的令牌数（用于 RPM）
+
+        Returns:
+            int: 获得许可的请求数
+        """
+        if self._unlimited:
+            return count
+
+        shards = len(self._rpm_shards or self._tpm_shards)
+        home = _current_shard(shards)
+        admitted = 0
+        for offset in range(shards):
+            if admitted == count:
+                break
+            shard = (home + offset) % shards
+            admitted += self._acquire_many_from_shard(shard, count - admitted, tokens_each)
+        return admitted
+
+    def _acquire_many_from_shard(self, shard: int, count: int, tokens_each: int) -> int:
+        """在单个分片中为一批请求获取许可。
+
+        Args:
+            shard: 分片编号
+            count: 请求数
+            tokens_each: 每个请求需要的令牌数（用于 RPM）
+
+        Returns:
+            int: 获得许可的请求数
+        """
+        rpm_limiter = self._rpm_shards[shard] if self._rpm_shards else None
+        tpm_limiter = self._tpm_shards[shard] if self._tpm_shards else None
+
+        admitted = count
+        if rpm_limiter is not None:
+            admitted = rpm_limiter.acquire_many([tokens_each] * count)
+        if tpm_limiter is not None:
+            tpm_admitted = tpm_limiter.acquire_many(admitted)
+            if rpm_limiter is not None and tpm_admitted < admitted:
+                rpm_limiter.release((admitted - tpm_admitted) * tokens_each)
+            admitted = tpm_admitted
+        return admitted
 
     async def wait_for_permission(self, tokens: int = 1) -> None:
         """等待直到获得流控许可。
@@ -189,20 +635,11 @@ class RateLimiter:
         Args:
             tokens: 需要的令牌数
         """
-        if not self.config.enabled:
+        if self._unlimited:
             return
 
-        # 同时等待两个限制
-        tasks = []
-
-        if self._rpm_limiter:
-            tasks.append(self._rpm_limiter.wait_for_token(tokens))
-
-        if self._tpm_limiter:
-            tasks.append(self._tpm_limiter.wait_for_slot())
-
-        if tasks:
-            await asyncio.gather(*tasks)
+        # 失败时排队，由调度任务在预计可以获得许可的时间重试
+        await self._queue.wait(tokens)
 
     def get_stats(self) -> dict[str, Any]:
         """获取流控统计信息。
@@ -217,13 +654,14 @@ class RateLimiter:
             "burst_size": self.config.burst_size,
         }
 
-        if self._rpm_limiter:
-            stats["rpm_available_tokens"] = round(self._rpm_limiter.tokens, 2)  # type: ignore[assignment]
-            stats["rpm_bucket_size"] = self._rpm_limiter.burst  # type: ignore[assignment]
+        # 分片时汇总各分片的统计，各分片的容量之和等于配置的限制
+        if self._rpm_shards:
+            stats["rpm_available_tokens"] = round(sum(b.tokens for b in self._rpm_shards), 2)  # type: ignore[assignment]
+            stats["rpm_bucket_size"] = sum(b.burst for b in self._rpm_shards)  # type: ignore[assignment]
 
-        if self._tpm_limiter:
-            stats["tpm_current_requests"] = len(self._tpm_limiter.requests)
-            stats["tpm_limit"] = self._tpm_limiter.limit
+        if self._tpm_shards:
+            stats["tpm_current_requests"] = sum(len(w) for w in self._tpm_shards)
+            stats["tpm_limit"] = sum(w.limit for w in self._tpm_shards)
 
         return stats
 
@@ -1,14 +1,37 @@
 """Pytest 配置和共享 fixtures。"""
 
+import asyncio
 import os
+from collections.abc import Callable
 from typing import Generator
 from unittest.mock import AsyncMock, Mock
 
 import pytest
-from langchain_openai import ChatOpenAI
 
 from logginganalysis.config.settings import Settings, reset_settings
 
+try:
+    import uvloop
+except ImportError:  # uvloop 不支持 Windows，未安装时使用 pytest-asyncio 默认的事件循环
+    uvloop = None
+
+
+if uvloop is not None:
+
+    def pytest_asyncio_loop_factories(
+        config: pytest.Config, item: pytest.Item
+    ) -> dict[str, Callable[[], asyncio.AbstractEventLoop]]:
+        """使用 uvloop 创建会话级事件循环运行异步测试。
+
+        Args:
+            config: pytest 配置
+            item: 当前测试项
+
+        Returns:
+            dict: 事件循环名称到事件循环工厂的映射
+        """
+        return {"uvloop": uvloop.new_event_loop}
+
 
 @pytest.fixture
 def mock_settings() -> Settings:
@@ -67,96 +90,28 @@ def sample_large_log() -> str:
 @pytest.fixture
 def mock_llm() -> Mock:
     """Mock LLM for testing."""
-    llm = Mock(spec=ChatOpenAI)
+    llm = Mock()
     llm.ainvoke = AsyncMock()
     return llm
 
 
-@pytest.fixture
-def mock_extraction_response() -> dict:
-    """Mock extraction response from LLM."""
-    return {
-        "chunk_id": "test-chunk-1",
-        "exceptions": [
-            {
-                "type": "ConnectionError",
-                "message": "Database connection timeout",
-                "stack_trace": None,
-                "occurrence_count": 2,
-            }
-        ],
-        "libraries": [
-            {
-                "name": "FastAPI",
-                "version": "0.104.1",
-                "context": "FastAPI version 0.104.1 starting up",
-            },
-            {
-                "name": "SQLAlchemy",
-                "version": None,
-                "context": "SQLAlchemy engine initialized",
-            },
-        ],
-        "problematic_behaviors": [
-            {
-                "category": "database",
-                "description": "Multiple database connection failures",
-                "severity": "high",
-                "occurrences": [
-                    "ERROR Database connection failed: timeout after 30s",
-                    "ERROR Exception: ConnectionError",
-                ],
-            }
-        ],
-        "summary": "Application startup with database connection issues",
-    }
-
-
-@pytest.fixture
-def mock_integration_response() -> dict:
-    """Mock integration response from LLM."""
-    return {
-        "overall_summary": "The system is experiencing database connectivity issues during startup. "
-        "Multiple connection timeout errors indicate a potential database service problem.",
-        "key_findings": [
-            {
-                "category": "database",
-                "description": "Database connection pool exhaustion detected",
-                "evidence": [
-                    "Multiple connection timeout errors",
-                    "ConnectionError exceptions in logs",
-                ],
-                "recommendations": [
-                    "Check database service availability",
-                    "Increase connection timeout",
-                    "Review connection pool configuration",
-                ],
-            }
-        ],
-        "root_cause_analysis": "The root cause appears to be database service unavailability or network connectivity issues. "
-        "The application is correctly retrying connections but ultimately failing.",
-        "system_context": {
-            "framework": "FastAPI",
-            "language": "Python",
-            "database": "PostgreSQL",
-            "cache": "Redis",
-        },
-        "confidence_score": 0.85,
-    }
+@pytest.fixture(scope="session", autouse=True)
+def reset_settings_session_fixture() -> None:
+    """Reset settings once before the first test."""
+    reset_settings()
 
 
 @pytest.fixture(autouse=True)
 def reset_settings_fixture() -> Generator[None, None, None]:
-    """Reset settings before each test."""
-    reset_settings()
+    """Reset settings after each test."""
     yield
     reset_settings()
 
 
-@pytest.fixture
-def temp_env_file(tmp_path) -> Generator[str, None, None]:
-    """Create a temporary .env file for testing."""
-    env_file = tmp_path / ".env"
+@pytest.fixture(scope="session")
+def temp_env_file(tmp_path_factory) -> str:
+    """Create a temporary .env file for testing (once per session)."""
+    env_file = tmp_path_factory.mktemp("env") / ".env"
     env_file.write_text(
         """OPENAI_API_KEY=test-key-for-testing
 EXTRACTION_MODEL=gpt-4o-mini
@@ -169,7 +124,10 @@ CHUNK_OVERLAP=200
 
 
 @pytest.fixture
-def set_test_env(temp_env_file: str, monkeypatch) -> None:
-    """Set environment variables for testing."""
-    monkeypatch.setenv("ENV_FILE", temp_env_file)
+def set_test_env(monkeypatch) -> None:
+    """Set environment variables for testing (in memory, no .env file)."""
     monkeypatch.setenv("OPENAI_API_KEY", "test-key-for-testing")
+    monkeypatch.setenv("EXTRACTION_MODEL", "gpt-4o-mini")
+    monkeypatch.setenv("INTEGRATION_MODEL", "gpt-4o")
+    monkeypatch.setenv("CHUNK_SIZE", "2000")
+    monkeypatch.setenv("CHUNK_OVERLAP", "200")
@@ -1,50 +1,75 @@
 """分块器测试。"""
 
+from functools import cache
+
 import pytest
 
 from logginganalysis.chunking.splitter import ChunkStrategy, LogChunker
 from logginganalysis.utils.exceptions import ChunkingError
 
 
+@pytest.fixture(scope="module")
+def make_chunker():
+    """创建按参数缓存的分块器工厂（分块器初始化后无可变状态，可安全复用）。"""
+
+    @cache
+    def _make(
+        chunk_size: int = 4000,
+        chunk_overlap: int = 200,
+        strategy: ChunkStrategy = ChunkStrategy.RECURSIVE,
+    ) -> LogChunker:
+        return LogChunker(chunk_size=chunk_size, chunk_overlap=chunk_overlap, strategy=strategy)
+
+    return _make
+
+
+@pytest.fixture(scope="module")
+def small_chunker(make_chunker):
+    """创建无重叠的分块器（只读，模块内共享）。"""
+    return make_chunker(chunk_size=1000, chunk_overlap=0)
+
+
 class TestLogChunker:
     """LogChunker 测试。"""
 
-    def test_chunker_initialization(self):
-        """测试分块器初始化。"""
-        chunker = LogChunker(
-            chunk_size=1000,
-            chunk_overlap=100,
-            strategy=ChunkStrategy.RECURSIVE,
-        )
-        assert chunker.chunk_size == 1000
-        assert chunker.chunk_overlap == 100
-        assert chunker.strategy == ChunkStrategy.RECURSIVE
-
-    def test_chunker_default_strategy(self):
-        """测试分块器默认策略。"""
-        chunker = LogChunker()
-        assert chunker.strategy == ChunkStrategy.RECURSIVE
-
-    def test_chunk_empty_log(self):
-        """测试处理空日志。"""
-        chunker = LogChunker()
-        chunks = chunker.chunk_log("")
-        assert chunks.chunks == []
-        assert chunks.total_size == 0
-        assert chunks.original_log_size == 0
-
-    def test_chunk_small_log(self):
-        """测试处理小日志（小于 chunk_size）。"""
-        chunker = LogChunker(chunk_size=1000, chunk_overlap=0)
-        small_log = "2025-12-31 10:00:00 INFO Test log entry\n"
-        chunks = chunker.chunk_log(small_log)
-        assert len(chunks.chunks) == 1
-        assert chunks.chunks[0].content == "2025-12-31 10:00:00 INFO Test log entry"  # 去除了换行符
-        assert chunks.original_log_size == len(small_log)
-
-    def test_chunk_large_log(self):
+    @pytest.mark.parametrize(
+        "kwargs, expected",
+        [
+            ({}, (4000, 200, ChunkStrategy.RECURSIVE)),
+            (
+                {"chunk_size": 1000, "chunk_overlap": 100, "strategy": ChunkStrategy.RECURSIVE},
+                (1000, 100, ChunkStrategy.RECURSIVE),
+            ),
+        ],
+        ids=["default", "custom"],
+    )
+    def test_chunker_initialization(self, kwargs, expected):
+        """测试分块器初始化及默认策略。"""
+        chunker = LogChunker(**kwargs)
+        assert (chunker.chunk_size, chunker.chunk_overlap, chunker.strategy) == expected
+
+    @pytest.mark.parametrize(
+        "content, expected_contents",
+        [
+            ("", []),
+            # 小于 chunk_size 的日志，末尾换行符会被去除
+            (
+                "2025-12-31 10:00:00 INFO Test log entry\n",
+                ["2025-12-31 10:00:00 INFO Test log entry"],
+            ),
+        ],
+        ids=["empty", "small"],
+    )
+    def test_chunk_sizes(self, small_chunker, content, expected_contents):
+        """测试处理空日志和小日志。"""
+        chunks = small_chunker.chunk_log(content)
+        assert [chunk.content for chunk in chunks.chunks] == expected_contents
+        assert chunks.total_size == sum(len(c) for c in expected_contents)
+        assert chunks.original_log_size == len(content)
+
+    def test_chunk_large_log(self, make_chunker):
         """测试处理大日志（需要分块）。"""
-        chunker = LogChunker(chunk_size=200, chunk_overlap=50)
+        chunker = make_chunker(chunk_size=200, chunk_overlap=50)
         # 创建足够大的日志
         large_log = "\n".join(
             f"2025-12-31 10:00:{i:02d} INFO Log entry number {i} - " + "x" * 50 for i in range(20)
@@ -53,9 +78,9 @@ class TestLogChunker:
         assert len(chunks.chunks) > 1
         assert chunks.original_log_size == len(large_log)
 
-    def test_chunk_with_metadata(self):
+    def test_chunk_with_metadata(self, make_chunker):
         """测试带元数据的分块。"""
-        chunker = LogChunker(chunk_size=500, chunk_overlap=50)
+        chunker = make_chunker(chunk_size=500, chunk_overlap=50)
         log_content = "Line 1\nLine 2\nLine 3\n" * 50
         metadata = {"source": "test.log", "level": "INFO"}
 
@@ -68,46 +93,22 @@ class TestLogChunker:
             assert "chunk_number" in chunk.metadata
             assert "chunk_strategy" in chunk.metadata
 
-    def test_chunk_positions(self):
+    def test_chunk_positions(self, make_chunker):
         """测试分块位置信息。"""
-        chunker = LogChunker(chunk_size=100, chunk_overlap=20)
+        chunker = make_chunker(chunk_size=100, chunk_overlap=20)
         log_content = "A" * 50 + "\n" + "B" * 50 + "\n" + "C" * 50
 
         chunks = chunker.chunk_log(log_content)
 
         # 检查起始和结束位置
-        for i, chunk in enumerate(chunks.chunks):
-            assert chunk.start_index >= 0
-            assert chunk.end_index <= len(log_content)
-            assert chunk.end_index > chunk.start_index
-
-            # 检查内容匹配
-            expected_content = log_content[chunk.start_index : chunk.end_index]
-            assert chunk.content == expected_content
-
-    def test_chunk_line_based_strategy(self, sample_log_content):
-        """测试基于行的分块策略。"""
-        chunker = LogChunker(
-            chunk_size=200,
-            chunk_overlap=0,
-            strategy=ChunkStrategy.LINE_BASED,
-        )
-        chunks = chunker.chunk_log(sample_log_content)
-        assert len(chunks.chunks) > 0
+        assert all(0 <= c.start_index < c.end_index <= len(log_content) for c in chunks.chunks)
 
-    def test_chunk_error_boundaries_strategy(self, sample_log_content):
-        """测试错误边界分块策略。"""
-        chunker = LogChunker(
-            chunk_size=500,
-            chunk_overlap=50,
-            strategy=ChunkStrategy.ERROR_BOUNDARIES,
-        )
-        chunks = chunker.chunk_log(sample_log_content)
-        assert len(chunks.chunks) > 0
+        # 检查内容匹配
+        assert all(c.content == log_content[c.start_index : c.end_index] for c in chunks.chunks)
 
-    def test_chunk_total_size_calculation(self):
+    def test_chunk_total_size_calculation(self, make_chunker):
         """测试总大小计算。"""
-        chunker = LogChunker(chunk_size=100, chunk_overlap=20)
+        chunker = make_chunker(chunk_size=100, chunk_overlap=20)
         log_content = "A" * 150 + "\n" + "B" * 150
 
         chunks = chunker.chunk_log(log_content)
@@ -116,35 +117,23 @@ class TestLogChunker:
         expected_total = sum(len(c.content) for c in chunks.chunks)
         assert chunks.total_size == expected_total
 
-    def test_chunk_with_multibyte_characters(self):
+    def test_chunk_with_multibyte_characters(self, make_chunker):
         """测试包含多字节字符的分块。"""
-        chunker = LogChunker(chunk_size=50, chunk_overlap=10)
+        chunker = make_chunker(chunk_size=50, chunk_overlap=10)
         log_content = "中文日志内容测试\n" + "日本語ログ\n" + "한국어 로그\n" * 10
 
         chunks = chunker.chunk_log(log_content)
         assert len(chunks.chunks) > 0
 
-        # 验证内容没有损坏
-        for chunk in chunks.chunks:
-            # 确保字符计数正确
-            assert len(chunk.content) == len(chunk.content)
-
 
 class TestChunkStrategies:
     """分块策略测试。"""
 
-    def test_recursive_strategy_default(self):
-        """测试递归策略为默认。"""
-        chunker = LogChunker()
-        assert chunker.strategy == ChunkStrategy.RECURSIVE
-
-    def test_all_strategies_enum(self):
-        """测试所有策略枚举值。"""
-        strategies = [
-            ChunkStrategy.RECURSIVE,
-            ChunkStrategy.LINE_BASED,
-            ChunkStrategy.ERROR_BOUNDARIES,
-        ]
-        for strategy in strategies:
-            chunker = LogChunker(strategy=strategy)
-            assert chunker.strategy == strategy
+    @pytest.mark.parametrize("strategy", list(ChunkStrategy))
+    def test_chunk_with_strategy(self, make_chunker, strategy, sample_log_content):
+        """测试各分块策略均可正常分块。"""
+        chunker = make_chunker(chunk_size=200, chunk_overlap=0, strategy=strategy)
+        assert chunker.strategy == strategy
+
+        chunks = chunker.chunk_log(sample_log_content)
+        assert len(chunks.chunks) > 0
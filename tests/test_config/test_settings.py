@@ -74,15 +74,24 @@ class TestGetSettings:
         assert settings.extraction_model == "gpt-3.5-turbo"
         assert settings.chunk_size == 2000
 
-    def test_get_settings_from_file(self, temp_env_file, monkeypatch):
-        """测试从 .env 文件加载配置。"""
+    def test_get_settings_from_env(self, monkeypatch):
+        """测试环境变量覆盖 API 密钥。"""
         reset_settings()
-        # 设置环境变量指向测试文件
         monkeypatch.setenv("OPENAI_API_KEY", "file-test-key")
 
         settings = get_settings()
         assert settings.openai_api_key == "file-test-key"
 
+    def test_settings_from_file(self, temp_env_file, monkeypatch):
+        """测试从 .env 文件加载配置。"""
+        for name in ("OPENAI_API_KEY", "CHUNK_SIZE", "CHUNK_OVERLAP"):
+            monkeypatch.delenv(name, raising=False)
+
+        settings = Settings(_env_file=temp_env_file)
+        assert settings.openai_api_key == "test-key-for-testing"
+        assert settings.chunk_size == 2000
+        assert settings.chunk_overlap == 200
+
 
 class TestResetSettings:
     """reset_settings 函数测试。"""
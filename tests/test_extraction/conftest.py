@@ -0,0 +1,21 @@
+"""提取模块测试共享的 fixtures。"""
+
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from logginganalysis.extraction.extractor import LogExtractor
+
+
+@pytest.fixture
+def mock_chain() -> Mock:
+    """创建 mock chain。"""
+    chain = Mock()
+    chain.ainvoke = AsyncMock()
+    return chain
+
+
+@pytest.fixture
+def extractor(mock_chain: Mock) -> LogExtractor:
+    """创建使用 mock chain 的提取器。"""
+    return LogExtractor(chain=mock_chain)
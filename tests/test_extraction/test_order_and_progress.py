@@ -1,5 +1,7 @@
 """测试编号顺序和进度计算的修复。"""
 
+import asyncio
+
 import pytest
 from unittest.mock import AsyncMock, Mock
 
@@ -114,3 +116,101 @@ async def test_progress_callback_with_correct_percentage():
 
     assert first_progress == 50.0  # (1 / 2) * 100
     assert second_progress == 100.0  # (2 / 2) * 100
+
+
+@pytest.mark.asyncio
+async def test_progress_follows_completion_order():
+    """测试进度按完成顺序上报，结果仍保持原始顺序。"""
+    chunks = LogChunks(
+        chunks=[
+            LogChunk(id=f"chunk-{i + 1}", content=f"chunk {i}", start_index=i, end_index=i + 1)
+            for i in range(3)
+        ],
+        total_size=3,
+        original_log_size=3,
+    )
+
+    async def mock_invoke(inputs):
+        # 越靠前的chunk完成得越晚
+        index = int(inputs["log_chunk"].split()[-1])
+        await asyncio.sleep(0.01 * (3 - index))
+        return ChunkExtractionResult(summary=inputs["log_chunk"])
+
+    mock_chain = Mock()
+    mock_chain.ainvoke = AsyncMock(side_effect=mock_invoke)
+
+    progress_updates = []
+    extractor = LogExtractor(chain=mock_chain, progress_callback=progress_updates.append)
+    results = await extractor.extract_from_chunks(chunks, max_concurrency=3)
+
+    assert [r.chunk_id for r in results] == ["chunk-1", "chunk-2", "chunk-3"]
+    # 与 LogAnalyzer 一致，进度回调收到的是普通字典
+    assert all(type(u) is dict for u in progress_updates)
+
+    completed_updates = [u for u in progress_updates if u["status"] == "completed"]
+    assert [u["chunk_id"] for u in completed_updates] == ["chunk-3", "chunk-2", "chunk-1"]
+    assert [u["progress_percentage"] for u in completed_updates] == [
+        pytest.approx(100 / 3),
+        pytest.approx(200 / 3),
+        100.0,
+    ]
+
+
+@pytest.mark.asyncio
+async def test_progress_updates_are_coalesced():
+    """测试大量chunk时完成进度被合并上报，且最终进度总是 100%。"""
+    total = 500
+    chunks = LogChunks(
+        chunks=[
+            LogChunk(id=f"chunk-{i}", content="x", start_index=i, end_index=i + 1)
+            for i in range(total)
+        ],
+        total_size=total,
+        original_log_size=total,
+    )
+
+    mock_chain = Mock()
+    mock_chain.ainvoke = AsyncMock(return_value=ChunkExtractionResult(summary="Summary"))
+
+    progress_updates = []
+    extractor = LogExtractor(
+        chain=mock_chain,
+        progress_callback=progress_updates.append,
+        progress_threshold_percent=1.0,
+        progress_min_interval_s=60,
+    )
+    results = await extractor.extract_from_chunks(chunks, max_concurrency=50)
+
+    assert len(results) == total
+
+    completed_updates = [u for u in progress_updates if u["status"] == "completed"]
+    assert 50 <= len(completed_updates) <= 101
+    assert completed_updates[-1]["progress_percentage"] == 100.0
+
+    processing_updates = [u for u in progress_updates if u["status"] == "processing"]
+    assert 1 <= len(processing_updates) <= 101
+
+
+@pytest.mark.asyncio
+async def test_progress_updates_not_coalesced_by_default():
+    """测试默认情况下超过 100 个chunk时每个chunk的进度都会上报。"""
+    total = 150
+    chunks = LogChunks(
+        chunks=[
+            LogChunk(id=f"chunk-{i}", content="x", start_index=i, end_index=i + 1)
+            for i in range(total)
+        ],
+        total_size=total,
+        original_log_size=total,
+    )
+
+    mock_chain = Mock()
+    mock_chain.ainvoke = AsyncMock(return_value=ChunkExtractionResult(summary="Summary"))
+
+    progress_updates = []
+    extractor = LogExtractor(chain=mock_chain, progress_callback=progress_updates.append)
+    await extractor.extract_from_chunks(chunks, max_concurrency=50)
+
+    statuses = [u["status"] for u in progress_updates]
+    assert statuses.count("processing") == total
+    assert statuses.count("completed") == total
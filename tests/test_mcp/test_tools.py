@@ -1,8 +1,16 @@
 """MCP 工具测试。"""
 
 import pytest
+from jsonschema.exceptions import SchemaError
+from mcp.types import Tool
 
-from logginganalysis.mcp.tools import get_tool, get_tools, validate_tool_arguments
+from logginganalysis.mcp.tools import (
+    _UNKNOWN_TOOLS,
+    _reload_tools,
+    get_tool,
+    get_tools,
+    validate_tool_arguments,
+)
 
 
 class TestMCPTools:
@@ -81,6 +89,42 @@ class TestMCPTools:
         assert valid is False
         assert "log_content" in error
 
+    def test_validate_analyze_log_invalid_type(self):
+        """测试验证参数类型错误。"""
+        valid, error = validate_tool_arguments(
+            "analyze_log", {"log_content": "test", "enable_search": "yes"}
+        )
+        assert valid is False
+        assert "enable_search" in error
+
+    def test_tools_are_cached(self):
+        """测试工具列表被缓存，清空缓存后重新构建。"""
+        assert get_tools() is get_tools()
+
+        _reload_tools()
+        assert get_tool("analyze_log") is not None
+
+    def test_unknown_tool_negative_cache(self):
+        """测试未知工具名称进入负缓存，重新加载时清空。"""
+        assert get_tool("nonexistent_tool") is None
+        assert "nonexistent_tool" in _UNKNOWN_TOOLS
+        assert get_tool("nonexistent_tool") is None
+
+        _reload_tools()
+        assert "nonexistent_tool" not in _UNKNOWN_TOOLS
+
+    def test_invalid_schema_rejected_on_reload(self, monkeypatch):
+        """测试重新加载工具时检查 schema 本身的有效性，失败时不破坏缓存。"""
+        bad_tool = Tool(name="bad_tool", description="bad", inputSchema={"type": 12})
+        monkeypatch.setattr("logginganalysis.mcp.tools.AVAILABLE_TOOLS", [bad_tool])
+        with pytest.raises(SchemaError):
+            _reload_tools()
+
+        # 重新加载失败时保留原有缓存
+        assert get_tool("bad_tool") is None
+        assert get_tool("analyze_log") is not None
+        assert validate_tool_arguments("analyze_log", {"log_content": "x"}) == (True, None)
+
     def test_validate_unknown_tool(self):
         """测试验证未知工具。"""
         valid, error = validate_tool_arguments("unknown_tool", {})
@@ -19,9 +19,15 @@ class TestLogChunk:
         assert chunk.content == "2025-12-31 10:00:00 INFO Test log"
         assert chunk.start_index == 0
         assert chunk.end_index == 25
-        assert chunk.id is not None  # 自动生成的 UUID
+        assert chunk.id is not None  # 自动生成的标识
         assert chunk.metadata == {}
 
+    def test_chunk_id_format(self):
+        """测试自动生成的标识为 16 位十六进制。"""
+        chunk = LogChunk(content="Test log", start_index=0, end_index=8)
+        assert len(chunk.id) == 16
+        int(chunk.id, 16)
+
     def test_create_log_chunk_with_metadata(self):
         """测试创建带元数据的日志块。"""
         chunk = LogChunk(
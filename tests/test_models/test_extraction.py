@@ -1,6 +1,7 @@
 """提取结果模型测试。"""
 
 import pytest
+from pydantic import ValidationError
 
 from logginganalysis.models.extraction import (
     ChunkExtractionResult,
@@ -26,6 +27,15 @@ class TestExceptionInfo:
         assert exc.stack_trace == "Traceback..."
         assert exc.occurrence_count == 3
 
+    def test_exception_info_frozen_and_hashable(self):
+        """测试异常信息不可变，并可用于去重。"""
+        exc = ExceptionInfo(type="ValueError", message="Invalid value")
+        with pytest.raises(ValidationError):
+            exc.message = "changed"
+
+        duplicate = ExceptionInfo(type="ValueError", message="Invalid value")
+        assert len({exc, duplicate}) == 1
+
     def test_exception_info_defaults(self):
         """测试异常信息默认值。"""
         exc = ExceptionInfo(
@@ -89,6 +99,18 @@ class TestProblematicBehavior:
             )
             assert behavior.severity == severity
 
+    def test_problematic_behavior_category_canonicalized(self):
+        """测试相同的问题类别共享同一个字符串对象。"""
+        # 运行时拼接得到未驻留的字符串，字面量会与表中的键共享对象
+        category = "".join(["data", "base"])  # noqa: FLY002
+        first = ProblematicBehavior(category=category, description="A")
+        second = ProblematicBehavior(category="database", description="B")
+        assert first.category is second.category
+
+        # 未知类别原样保留，不做规范化
+        unknown = "".join(["custom", "_category"])  # noqa: FLY002
+        assert ProblematicBehavior(category=unknown, description="C").category is unknown
+
     def test_problematic_behavior_defaults(self):
         """测试问题行为默认值。"""
         behavior = ProblematicBehavior(
@@ -1,5 +1,7 @@
 """报告格式化器测试。"""
 
+from functools import cache
+
 import pytest
 
 from logginganalysis.models.extraction import ChunkExtractionResult
@@ -14,50 +16,108 @@ from logginganalysis.reporting.formatters import (
 )
 
 
-class TestMarkdownFormatter:
-    """MarkdownFormatter 测试。"""
-
-    @pytest.fixture
-    def sample_report(self):
-        """创建示例报告。"""
-        metadata = ReportMetadata(
-            log_source="test.log",
-            log_size_bytes=1024,
-            chunk_count=5,
-            models_used={"extraction": "gpt-4o-mini", "integration": "gpt-4o"},
-            processing_time_seconds=5.5,
+@cache
+def _markdown_report() -> AnalysisReport:
+    """创建 Markdown 格式化测试使用的示例报告。"""
+    metadata = ReportMetadata(
+        log_source="test.log",
+        log_size_bytes=1024,
+        chunk_count=5,
+        models_used={"extraction": "gpt-4o-mini", "integration": "gpt-4o"},
+        processing_time_seconds=5.5,
+    )
+
+    analysis = IntegratedAnalysis(
+        overall_summary="Test overall summary",
+        key_findings=[
+            AnalysisInsight(
+                category="database",
+                description="Database connection issues",
+                evidence=["Connection timeout", "Retry attempts"],
+                recommendations=["Check database", "Increase timeout"],
+            )
+        ],
+        root_cause_analysis="Database service unavailable",
+        system_context={"framework": "FastAPI", "database": "PostgreSQL"},
+        confidence_score=0.85,
+    )
+
+    extractions = [
+        ChunkExtractionResult(
+            chunk_id="chunk-1",
+            summary="First chunk",
+            exceptions=[],
+            libraries=[],
+            problematic_behaviors=[],
         )
+    ]
+
+    return AnalysisReport(
+        metadata=metadata,
+        analysis=analysis,
+        raw_extractions=extractions,
+    )
+
+
+@cache
+def _json_report() -> AnalysisReport:
+    """创建 JSON 格式化测试使用的示例报告。"""
+    metadata = ReportMetadata(
+        log_source=None,
+        log_size_bytes=500,
+        chunk_count=2,
+        models_used={"extraction": "gpt-4o-mini"},
+        processing_time_seconds=1.0,
+    )
+
+    analysis = IntegratedAnalysis(
+        overall_summary="Test summary",
+        key_findings=[],
+        root_cause_analysis=None,
+        system_context={},
+        confidence_score=0.75,
+    )
+
+    return AnalysisReport(
+        metadata=metadata,
+        analysis=analysis,
+        raw_extractions=[],
+    )
+
+
+@cache
+def _text_report() -> AnalysisReport:
+    """创建纯文本格式化测试使用的示例报告。"""
+    metadata = ReportMetadata(
+        log_source="app.log",
+        log_size_bytes=2048,
+        chunk_count=3,
+        models_used={"extraction": "gpt-4o-mini"},
+        processing_time_seconds=2.5,
+    )
+
+    analysis = IntegratedAnalysis(
+        overall_summary="System running normally",
+        key_findings=[],
+        root_cause_analysis=None,
+        system_context={},
+        confidence_score=0.9,
+    )
+
+    return AnalysisReport(
+        metadata=metadata,
+        analysis=analysis,
+        raw_extractions=[],
+    )
 
-        analysis = IntegratedAnalysis(
-            overall_summary="Test overall summary",
-            key_findings=[
-                AnalysisInsight(
-                    category="database",
-                    description="Database connection issues",
-                    evidence=["Connection timeout", "Retry attempts"],
-                    recommendations=["Check database", "Increase timeout"],
-                )
-            ],
-            root_cause_analysis="Database service unavailable",
-            system_context={"framework": "FastAPI", "database": "PostgreSQL"},
-            confidence_score=0.85,
-        )
 
-        extractions = [
-            ChunkExtractionResult(
-                chunk_id="chunk-1",
-                summary="First chunk",
-                exceptions=[],
-                libraries=[],
-                problematic_behaviors=[],
-            )
-        ]
+class TestMarkdownFormatter:
+    """MarkdownFormatter 测试。"""
 
-        return AnalysisReport(
-            metadata=metadata,
-            analysis=analysis,
-            raw_extractions=extractions,
-        )
+    @pytest.fixture(scope="module")
+    def sample_report(self):
+        """示例报告。"""
+        return _markdown_report()
 
     def test_markdown_formatter_basic(self, sample_report):
         """测试 Markdown 基本格式化。"""
@@ -86,6 +146,14 @@ class TestMarkdownFormatter:
         # 检查置信度条字符
         assert "█" in result or "░" in result
 
+    def test_confidence_bar_bounds(self):
+        """测试置信度条在边界值及越界值时的长度和填充。"""
+        formatter = MarkdownFormatter()
+        assert formatter._create_confidence_bar(0.0) == "░" * 20
+        assert formatter._create_confidence_bar(1.0) == "█" * 20
+        assert formatter._create_confidence_bar(0.85) == "█" * 17 + "░" * 3
+        assert formatter._create_confidence_bar(1.5) == "█" * 20
+
     def test_markdown_formatter_key_findings(self, sample_report):
         """测试关键发现格式化。"""
         formatter = MarkdownFormatter()
@@ -105,30 +173,10 @@ class TestMarkdownFormatter:
 class TestJSONFormatter:
     """JSONFormatter 测试。"""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def sample_report(self):
-        """创建示例报告。"""
-        metadata = ReportMetadata(
-            log_source=None,
-            log_size_bytes=500,
-            chunk_count=2,
-            models_used={"extraction": "gpt-4o-mini"},
-            processing_time_seconds=1.0,
-        )
-
-        analysis = IntegratedAnalysis(
-            overall_summary="Test summary",
-            key_findings=[],
-            root_cause_analysis=None,
-            system_context={},
-            confidence_score=0.75,
-        )
-
-        return AnalysisReport(
-            metadata=metadata,
-            analysis=analysis,
-            raw_extractions=[],
-        )
+        """示例报告。"""
+        return _json_report()
 
     def test_json_formatter_valid(self, sample_report):
         """测试 JSON 格式化器生成有效 JSON。"""
@@ -151,34 +199,26 @@ class TestJSONFormatter:
         assert '"analysis"' in result
         assert '"raw_extractions"' in result
 
+    def test_json_formatter_serialization_options(self, sample_report):
+        """测试 JSON 输出省略 None 字段，且不转义非 ASCII 字符。"""
+        import json
+
+        analysis = sample_report.analysis.model_copy(update={"overall_summary": "数据库连接超时"})
+        result = JSONFormatter().format(sample_report.model_copy(update={"analysis": analysis}))
+
+        assert "数据库连接超时" in result
+        data = json.loads(result)
+        assert "log_source" not in data["metadata"]
+        assert "root_cause_analysis" not in data["analysis"]
+
 
 class TestTextFormatter:
     """TextFormatter 测试。"""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def sample_report(self):
-        """创建示例报告。"""
-        metadata = ReportMetadata(
-            log_source="app.log",
-            log_size_bytes=2048,
-            chunk_count=3,
-            models_used={"extraction": "gpt-4o-mini"},
-            processing_time_seconds=2.5,
-        )
-
-        analysis = IntegratedAnalysis(
-            overall_summary="System running normally",
-            key_findings=[],
-            root_cause_analysis=None,
-            system_context={},
-            confidence_score=0.9,
-        )
-
-        return AnalysisReport(
-            metadata=metadata,
-            analysis=analysis,
-            raw_extractions=[],
-        )
+        """示例报告。"""
+        return _text_report()
 
     def test_text_formatter_basic(self, sample_report):
         """测试纯文本格式化。"""
@@ -217,6 +257,11 @@ class TestGetFormatter:
         formatter = get_formatter("text")
         assert isinstance(formatter, TextFormatter)
 
+    def test_get_formatter_returns_shared_instance(self):
+        """测试同一格式返回同一个格式化器实例。"""
+        assert get_formatter("markdown") is get_formatter("markdown")
+        assert get_formatter("json") is not get_formatter("text")
+
     def test_get_invalid_formatter(self):
         """测试获取无效格式化器。"""
         with pytest.raises(ValueError):
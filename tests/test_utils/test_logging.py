@@ -64,6 +64,27 @@ async def test_extract_from_chunks_with_progress_tracking(caplog):
         assert any("开始批量提取" in msg for msg in log_messages)
 
 
+@pytest.mark.asyncio
+async def test_extract_skips_info_logs_when_disabled(caplog):
+    """测试 INFO 级别未启用时不记录提取日志，但仍回调进度。"""
+    caplog.set_level(logging.WARNING, logger="logginganalysis.extraction.extractor")
+
+    chunker = LogChunker(chunk_size=4000, chunk_overlap=0)
+    chunks = chunker.chunk_log("2025-12-31 10:00:00 INFO Test log entry\n")
+
+    progress_updates = []
+
+    with patch("logginganalysis.extraction.extractor.create_extraction_chain") as mock_chain:
+        mock_result = ChunkExtractionResult(**MOCK_EXTRACTION_RESPONSE)
+        mock_chain.return_value = MagicMock(ainvoke=AsyncMock(return_value=mock_result))
+
+        extractor = LogExtractor(progress_callback=progress_updates.append)
+        await extractor.extract_from_chunk(chunks.chunks[0], chunk_index=0, total_chunks=1)
+
+    assert not [r for r in caplog.records if r.levelno == logging.INFO]
+    assert [u["status"] for u in progress_updates] == ["processing", "completed"]
+
+
 @pytest.mark.asyncio
 async def test_analyzer_with_progress_tracking(caplog):
     """测试分析器进度跟踪。"""
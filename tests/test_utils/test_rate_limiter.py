@@ -2,6 +2,7 @@
 
 import asyncio
 import time
+from unittest.mock import patch
 
 import pytest
 
@@ -18,8 +19,7 @@ from logginganalysis.utils.rate_limiter import (
 class TestTokenBucket:
     """TokenBucket 测试。"""
 
-    @pytest.mark.asyncio
-    async def test_token_bucket_initialization(self):
+    def test_token_bucket_initialization(self):
         """测试令牌桶初始化。"""
         bucket = TokenBucket(rate=60, burst=10)
         assert bucket.rate == 60
@@ -52,6 +52,43 @@ class TestTokenBucket:
         # 尝试获取更多
         assert await bucket.acquire(1) is False
 
+    @pytest.mark.asyncio
+    async def test_token_bucket_concurrent_acquire(self):
+        """测试并发获取令牌时不会超发。"""
+        bucket = TokenBucket(rate=60, burst=10)
+
+        results = await asyncio.gather(*(bucket.acquire(1) for _ in range(20)))
+
+        assert results.count(True) == 10
+
+    @pytest.mark.asyncio
+    async def test_token_bucket_deferred_refill_keeps_elapsed_time(self):
+        """测试跳过的补充不会丢失经过的时间。"""
+        bucket = TokenBucket(rate=60, burst=10)
+        bucket._min_refill_interval = 60
+        await bucket.acquire(5)
+
+        # 模拟经过 3 秒：令牌充足时跳过补充，不足时一次性补充全部经过时间
+        bucket.last_update -= 3
+        assert await bucket.acquire(5) is True
+        assert bucket.tokens == 0
+        assert await bucket.acquire(3) is True
+        assert bucket.tokens == pytest.approx(0, abs=0.01)
+
+    def test_token_bucket_clock_going_backwards(self, monkeypatch):
+        """测试首次获取时才记录时间，时钟回退时不会扣减令牌。"""
+        now = 5.0
+        monkeypatch.setattr("logginganalysis.utils.rate_limiter._loop_time", lambda: now)
+        bucket = TokenBucket(rate=60, burst=10)
+        assert bucket.last_update is None
+
+        assert bucket.try_acquire_or_next(5) is None
+        assert bucket.last_update == 5.0
+
+        now = 4.999
+        assert bucket.try_acquire_or_next(5) is None
+        assert bucket.tokens == 0
+
     @pytest.mark.asyncio
     async def test_token_bucket_refill(self):
         """测试令牌补充。"""
@@ -85,17 +122,105 @@ class TestTokenBucket:
         # 应该等待约 1 秒（1 token/sec）
         assert elapsed >= 0.9
 
+    @pytest.mark.asyncio
+    async def test_token_bucket_release_wakes_waiter(self):
+        """测试归还令牌时立即唤醒等待者，无需等到补充。"""
+        bucket = TokenBucket(rate=60, burst=1)  # 1 token/sec
+        await bucket.acquire(1)
+
+        start = time.time()
+        waiter = asyncio.create_task(bucket.wait_for_token(1))
+        await asyncio.sleep(0.05)
+        bucket.release(1)
+        await waiter
+
+        assert time.time() - start < 0.5
+
+    @pytest.mark.asyncio
+    async def test_token_bucket_concurrent_waiters(self):
+        """测试多个等待者并行休眠，总耗时约为所需令牌数 / 速率。"""
+        bucket = TokenBucket(rate=600, burst=1)  # 10 tokens/sec
+        await bucket.acquire(1)
+
+        start = time.time()
+        await asyncio.gather(*(bucket.wait_for_token(1) for _ in range(10)))
+        elapsed = time.time() - start
+
+        # 10 个令牌约需 1 秒，等待者串行休眠时会明显更久
+        assert 0.9 <= elapsed < 1.5
+
+    @pytest.mark.asyncio
+    async def test_token_bucket_waiters_served_in_order(self):
+        """测试大量等待者由调度任务按先后顺序唤醒。"""
+        bucket = TokenBucket(rate=6000, burst=10)  # 100 tokens/sec
+        await bucket.acquire(10)
+        completed = []
+
+        async def waiter(i):
+            await bucket.wait_for_token(1)
+            completed.append(i)
+
+        start = time.time()
+        await asyncio.gather(*(waiter(i) for i in range(100)))
+        elapsed = time.time() - start
+
+        assert completed == list(range(100))
+        assert 0.9 <= elapsed < 1.5
+        assert not bucket._queue._waiters
+
+    def test_token_bucket_acquire_many(self):
+        """测试批量获取时按顺序放行令牌足够的前若干个请求。"""
+        bucket = TokenBucket(rate=60, burst=10)
+
+        assert bucket.acquire_many([3, 3, 3, 3]) == 3
+        assert bucket.tokens == pytest.approx(1, abs=0.01)
+        assert bucket.acquire_many([2, 1]) == 0
+        assert bucket.acquire_many([]) == 0
+
+    @pytest.mark.asyncio
+    async def test_token_bucket_try_acquire_or_next(self):
+        """测试获取失败时返回令牌足够的时间。"""
+        bucket = TokenBucket(rate=60, burst=2)  # 1 token/sec
+
+        assert bucket.try_acquire_or_next(2) is None
+        next_at = bucket.try_acquire_or_next(1)
+
+        assert next_at == pytest.approx(asyncio.get_running_loop().time() + 1, abs=0.05)
+
+    def test_token_bucket_try_acquire_or_next_outside_loop(self):
+        """测试不在事件循环中时按单调时钟计算。"""
+        bucket = TokenBucket(rate=60, burst=2)
+
+        assert bucket.try_acquire_or_next(2) is None
+        assert bucket.try_acquire_or_next(1) == pytest.approx(time.monotonic() + 1, abs=0.05)
+
 
 class TestSlidingWindow:
     """SlidingWindow 测试。"""
 
-    @pytest.mark.asyncio
-    async def test_sliding_window_initialization(self):
+    def test_sliding_window_initialization(self):
         """测试滑动窗口初始化。"""
         window = SlidingWindow(limit=10, window=60)
         assert window.limit == 10
         assert window.window == 60
-        assert len(window.requests) == 0
+        assert len(window) == 0
+
+    def test_sliding_window_rejects_zero_limit(self):
+        """测试 limit 小于 1 时报错。"""
+        with pytest.raises(ValueError):
+            SlidingWindow(limit=0)
+
+    def test_seconds_until_slot_evicts_expired_buckets(self):
+        """测试计算等待时间前先清空已过期的桶。"""
+        window = SlidingWindow(limit=1, window=1)
+        assert window._try_admit(100.0)
+        assert window._seconds_until_slot(105.0) == 0.0
+        assert window._total == 0
+
+    def test_sliding_window_bucket_counts_width(self):
+        """测试 limit 在 32 位范围内时桶计数使用 32 位整数。"""
+        assert SlidingWindow(limit=100)._counts.itemsize == 4
+        assert SlidingWindow(limit=2**40)._counts.typecode == "Q"
 
     @pytest.mark.asyncio
     async def test_sliding_window_acquire_success(self):
@@ -103,7 +228,16 @@ class TestSlidingWindow:
         window = SlidingWindow(limit=10, window=60)
         success = await window.acquire()
         assert success is True
-        assert len(window.requests) == 1
+        assert len(window) == 1
+
+    def test_sliding_window_acquire_many(self):
+        """测试批量记录请求不超过窗口剩余配额。"""
+        window = SlidingWindow(limit=3, window=60)
+
+        assert window.acquire_many(2) == 2
+        assert window.acquire_many(5) == 1
+        assert window.acquire_many(1) == 0
+        assert len(window) == 3
 
     @pytest.mark.asyncio
     async def test_sliding_window_fill_up(self):
@@ -134,6 +268,34 @@ class TestSlidingWindow:
         # 现在应该可以获取新的许可
         assert await window.acquire() is True
 
+    @pytest.mark.asyncio
+    async def test_sliding_window_expires_by_bucket(self, monkeypatch):
+        """测试请求按时间桶整体过期。"""
+        now = 1000.0
+        monkeypatch.setattr("logginganalysis.utils.rate_limiter._loop_time", lambda: now)
+        window = SlidingWindow(limit=3, window=60)  # 每桶 1 秒
+
+        assert await window.acquire() is True
+        now = 1030.0
+        assert await window.acquire() is True
+        assert await window.acquire() is True
+        assert await window.acquire() is False
+
+        # 第一个请求所在的桶在窗口结束前仍然计数
+        now = 1059.9
+        assert await window.acquire() is False
+
+        now = 1060.5
+        assert await window.acquire() is True
+        assert await window.acquire() is False
+
+        # 空闲超过整个窗口后，环形数组中的所有桶都被清空
+        now = 1200.0
+        assert await window.acquire() is True
+        assert await window.acquire() is True
+        assert await window.acquire() is True
+        assert await window.acquire() is False
+
     @pytest.mark.asyncio
     async def test_sliding_window_wait_for_slot(self):
         """测试等待插槽。"""
@@ -192,6 +354,7 @@ class TestRateLimiter:
 
         assert limiter._rpm_limiter is None
         assert limiter._tpm_limiter is None
+        assert limiter._unlimited is True
 
     @pytest.mark.asyncio
     async def test_rate_limiter_acquire_success(self):
@@ -206,6 +369,82 @@ class TestRateLimiter:
         success = await limiter.acquire()
         assert success is True
 
+    @pytest.mark.asyncio
+    async def test_rate_limiter_releases_rpm_on_tpm_rejection(self):
+        """测试 TPM 拒绝时归还 RPM 令牌，并发获取时不超发。"""
+        config = RateLimitConfig(
+            tpm_limit=50,
+            rpm_limit=60,
+            burst_size=100,
+            enabled=True,
+        )
+        limiter = RateLimiter(config)
+
+        results = await asyncio.gather(*(limiter.acquire() for _ in range(1000)))
+
+        assert results.count(True) == 50
+        assert limiter._rpm_limiter.tokens == pytest.approx(50, abs=1)
+        assert len(limiter._tpm_limiter) == 50
+
+    def test_rate_limiter_acquire_many(self):
+        """测试批量获取许可时取各限制的较小值，并归还多获取的 RPM 令牌。"""
+        config = RateLimitConfig(tpm_limit=50, rpm_limit=60, burst_size=100, enabled=True)
+        limiter = RateLimiter(config)
+
+        assert limiter.acquire_many(80) == 50
+        assert limiter._rpm_limiter.tokens == pytest.approx(50, abs=1)
+        assert len(limiter._tpm_limiter) == 50
+        assert RateLimiter(RateLimitConfig(enabled=False)).acquire_many(80) == 80
+
+    @pytest.mark.asyncio
+    async def test_rate_limiter_tpm_only(self):
+        """测试只配置 TPM 限制时按窗口内请求数限制。"""
+        config = RateLimitConfig(tpm_limit=3, rpm_limit=None, enabled=True)
+        limiter = RateLimiter(config)
+
+        results = [await limiter.acquire() for _ in range(5)]
+
+        assert results == [True, True, True, False, False]
+        assert limiter.try_acquire_or_next() is not None
+
+    @pytest.mark.asyncio
+    async def test_rate_limiter_sharded_admission(self):
+        """测试分片后总体放行数等于配置的限制。"""
+        config = RateLimitConfig(rpm_limit=800, burst_size=800, shards=8, enabled=True)
+        limiter = RateLimiter(config)
+        assert len(limiter._rpm_shards) == 8
+        assert all(bucket.burst == 100 for bucket in limiter._rpm_shards)
+
+        results = await asyncio.gather(*(limiter.acquire() for _ in range(1000)))
+
+        assert results.count(True) == 800
+        stats = limiter.get_stats()
+        assert stats["rpm_bucket_size"] == 800
+        assert stats["rpm_available_tokens"] == pytest.approx(0, abs=1)
+
+    @pytest.mark.asyncio
+    async def test_rate_limiter_sharded_limits_add_up(self):
+        """测试分片时余数分给部分分片，各限制之和与配置一致。"""
+        config = RateLimitConfig(tpm_limit=10, rpm_limit=100, burst_size=5, shards=3)
+        limiter = RateLimiter(config)
+
+        assert [bucket.rate for bucket in limiter._rpm_shards] == [34, 33, 33]
+        assert [bucket.burst for bucket in limiter._rpm_shards] == [2, 2, 1]
+        assert limiter.get_stats()["tpm_limit"] == 10
+
+        # 单个任务可以用完所有分片的容量
+        assert [await limiter.acquire() for _ in range(6)] == [True] * 5 + [False]
+        assert limiter.acquire_many(3) == 0
+
+    def test_rate_limiter_rejects_more_shards_than_limit(self):
+        """测试分片数超过限制或突发容量时报错。"""
+        with pytest.raises(ValueError):
+            RateLimiter(RateLimitConfig(rpm_limit=5, tpm_limit=3, burst_size=2, shards=8))
+        with pytest.raises(ValueError):
+            RateLimiter(RateLimitConfig(tpm_limit=3, shards=4))
+        with pytest.raises(ValueError):
+            RateLimiter(RateLimitConfig(rpm_limit=60, shards=0))
+
     @pytest.mark.asyncio
     async def test_rate_limiter_acquire_disabled(self):
         """测试禁用流控时总是成功。"""
@@ -230,12 +469,35 @@ class TestRateLimiter:
         await limiter.acquire(tokens=2)
         start = time.time()
 
-        # 等待新许可
-        await limiter.wait_for_permission(tokens=1)
+        # 等待新许可：失败时休眠到预计时间，醒来后只需再检查一次
+        with patch.object(
+            limiter, "try_acquire_or_next", wraps=limiter.try_acquire_or_next
+        ) as try_acquire:
+            await limiter.wait_for_permission(tokens=1)
         elapsed = time.time() - start
 
         # 应该等待约 1 秒
         assert elapsed >= 0.8
+        assert try_acquire.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_rate_limiter_waiters_served_in_order(self):
+        """测试多个等待许可的协程由调度任务按先后顺序唤醒。"""
+        limiter = RateLimiter(RateLimitConfig(rpm_limit=600, burst_size=1))  # 10 tokens/sec
+        await limiter.acquire()
+        completed = []
+
+        async def waiter(i):
+            await with_rate_limit(limiter)
+            completed.append(i)
+
+        start = time.time()
+        await asyncio.gather(*(waiter(i) for i in range(10)))
+        elapsed = time.time() - start
+
+        assert completed == list(range(10))
+        assert 0.9 <= elapsed < 1.5
+        assert not limiter._queue._waiters
 
     def test_rate_limiter_get_stats(self):
         """测试获取统计信息。"""
@@ -290,6 +552,18 @@ class TestRateLimitContextManager:
         with pytest.raises(RateLimitError):
             await with_rate_limit(limiter, tokens=1, raise_on_limit=True)
 
+    @pytest.mark.asyncio
+    async def test_with_rate_limit_uses_overridden_acquire(self):
+        """测试流控上下文管理器调用子类重写的 acquire。"""
+
+        class DenyingLimiter(RateLimiter):
+            async def acquire(self, tokens: int = 1) -> bool:
+                return False
+
+        limiter = DenyingLimiter(RateLimitConfig(enabled=False))
+        with pytest.raises(RateLimitError):
+            await with_rate_limit(limiter, raise_on_limit=True)
+
     @pytest.mark.asyncio
     async def test_with_rate_limit_disabled(self):
         """测试禁用流控时不抛异常。"""
@@ -311,6 +585,7 @@ class TestRateLimitConfig:
         assert config.rpm_limit is None
         assert config.burst_size == 10
         assert config.enabled is True
+        assert config.shards == 1
 
     def test_config_custom_values(self):
         """测试自定义配置值。"""